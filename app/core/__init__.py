@@ -5,7 +5,7 @@ This module contains no UI dependencies.
 All watermark processing algorithms are implemented here.
 """
 
-from .blind import BlindWatermarkerAdapter
+from .blind import BlindWatermarkerAdapter, BlindEmbedPlan, BlindExtractPlan
 from .visible import VisibleWatermarker
 
-__all__ = ["VisibleWatermarker", "BlindWatermarkerAdapter"]
+__all__ = ["VisibleWatermarker", "BlindWatermarkerAdapter", "BlindEmbedPlan", "BlindExtractPlan"]
@@ -7,11 +7,14 @@ Technical Notes:
 - Uses frequency domain (DCT) watermarking for robustness
 - Password/seed affects the embedding pattern - MUST match for extraction
 - PNG format is REQUIRED to preserve watermark (JPEG compression destroys it)
+- Each source image is decoded once, straight into the array handed to
+  blind_watermark (no intermediate PNG files)
 - Data format: [MAGIC][LENGTH][DATA] for validation
 """
 
 import hashlib
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Union, Optional, Tuple
 
@@ -21,6 +24,26 @@ from PIL import Image
 from blind_watermark import WaterMark
 
 
+@dataclass(frozen=True)
+class BlindEmbedPlan:
+    """Per-batch embedding state: derived seed and encoded payload bits."""
+    seed: int
+    bits: np.ndarray
+    text_bytes: int
+
+    @property
+    def bit_length(self) -> int:
+        """Bit length needed for extraction."""
+        return len(self.bits)
+
+
+@dataclass(frozen=True)
+class BlindExtractPlan:
+    """Per-batch extraction state: derived seed and payload bit length."""
+    seed: int
+    bit_length: int
+
+
 class BlindWatermarkerAdapter:
     """
     Adapter class for the blind_watermark library.
@@ -49,9 +72,10 @@ class BlindWatermarkerAdapter:
     # Maximum supported text length in bytes
     MAX_TEXT_BYTES = 500
 
-    def __init__(self):
-        """Initialize the BlindWatermarkerAdapter."""
-        self._temp_files: list[Path] = []
+    # zlib level for the temporary PNGs written by embed_to_image (read
+    # straight back, only losslessness matters). Matches OpenCV's default
+    # for the watermarked output written by blind_watermark.
+    PNG_COMPRESS_LEVEL = 1
 
     def _password_to_seed(self, password: str) -> int:
         """
@@ -69,25 +93,58 @@ class BlindWatermarkerAdapter:
         seed = int.from_bytes(hash_bytes[:8], byteorder="big")
         return seed % (2 ** 31 - 1)
 
-    def _get_image_capacity(self, image_path: Path) -> int:
+    def _image_capacity(self, img: np.ndarray) -> int:
         """
         Calculate the maximum number of bits that can be embedded in an image.
         
         Args:
-            image_path: Path to the image file.
+            img: Decoded image array (see _read_image).
             
         Returns:
             Maximum embeddable bits.
         """
-        img = cv2.imread(str(image_path))
-        if img is None:
-            raise ValueError(f"Cannot read image: {image_path}")
-
         height, width = img.shape[:2]
         # Capacity formula: width * height / 64
         capacity = (width * height) // 64
         return capacity
 
+    def _read_image(self, image_path: Path, flags: int = cv2.IMREAD_UNCHANGED) -> np.ndarray:
+        """
+        Decode an image into the BGR(A) array blind_watermark works on.
+        
+        PNG files are read by OpenCV with the given flags, exactly as
+        blind_watermark would read them itself. Other formats are decoded
+        by Pillow and converted to 8-bit BGR, which is what a lossless PNG
+        round trip of their RGB data would give, without writing one.
+        
+        Args:
+            image_path: Path to the image file.
+            flags: cv2.imread flags for PNG files.
+            
+        Returns:
+            HxWx3 or HxWx4 uint8 array.
+        """
+        if image_path.suffix.lower() == ".png":
+            img = cv2.imread(str(image_path), flags)
+            if img is None:
+                raise ValueError(f"Cannot read image: {image_path}")
+            return img
+
+        with Image.open(image_path) as img:
+            return self._pil_to_array(img.convert("RGB"))
+
+    @staticmethod
+    def _pil_to_array(image: Image.Image) -> np.ndarray:
+        """
+        Convert a PIL image to the array OpenCV would read back from it
+        saved as PNG (BGRA for RGBA images, BGR otherwise).
+        """
+        if image.mode == "RGBA":
+            return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGBA2BGRA)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2BGR)
+
     def _text_to_bits(self, text: str) -> np.ndarray:
         """
         Convert text string to bit array for embedding.
@@ -180,30 +237,6 @@ class BlindWatermarkerAdapter:
         except UnicodeDecodeError as e:
             raise ValueError(f"Failed to decode text: {e}")
 
-    def _ensure_png_format(self, image_path: Path) -> Path:
-        """
-        Ensure the image is in PNG format for processing.
-        
-        Args:
-            image_path: Path to the input image.
-            
-        Returns:
-            Path to the PNG image (may be temporary).
-        """
-        if image_path.suffix.lower() == ".png":
-            return image_path
-
-        img = Image.open(image_path)
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-
-        temp_path = Path(tempfile.mktemp(suffix=".png"))
-        img.save(temp_path, "PNG")
-        img.close()
-        self._temp_files.append(temp_path)
-
-        return temp_path
-
     def get_max_text_length(self, image_path: Union[str, Path]) -> int:
         """
         Get the maximum text length (in bytes) that can be embedded in an image.
@@ -215,9 +248,11 @@ class BlindWatermarkerAdapter:
             Maximum text length in bytes.
         """
         image_path = Path(image_path)
-        png_path = self._ensure_png_format(image_path)
-        capacity_bits = self._get_image_capacity(png_path)
+        img = self._read_image(image_path, cv2.IMREAD_COLOR)
+        return self._max_text_length_for_capacity(self._image_capacity(img))
 
+    def _max_text_length_for_capacity(self, capacity_bits: int) -> int:
+        """Convert an image capacity in bits to a maximum text length in bytes."""
         # Subtract header size and convert to bytes
         available_bits = capacity_bits - self.HEADER_SIZE
         max_from_image = max(0, available_bits // 8)
@@ -225,6 +260,56 @@ class BlindWatermarkerAdapter:
         # Also cap at MAX_TEXT_BYTES
         return min(max_from_image, self.MAX_TEXT_BYTES)
 
+    def prepare(self, password: str, text: str) -> BlindEmbedPlan:
+        """
+        Validate and encode the password/text once for a batch of embeds.
+        
+        Args:
+            password: Password/key for watermark encryption.
+            text: Text to embed as watermark.
+            
+        Returns:
+            BlindEmbedPlan to pass to embed_with().
+            
+        Raises:
+            ValueError: If password or text is empty, or text too long.
+        """
+        if not password:
+            raise ValueError("Password cannot be empty")
+
+        if not text:
+            raise ValueError("Watermark text cannot be empty")
+
+        text_bytes = text.encode("utf-8")
+        if len(text_bytes) > self.MAX_TEXT_BYTES:
+            raise ValueError(
+                f"Text too long: {len(text_bytes)} bytes (max: {self.MAX_TEXT_BYTES})"
+            )
+
+        return BlindEmbedPlan(
+            seed=self._password_to_seed(password),
+            bits=self._text_to_bits(text),
+            text_bytes=len(text_bytes)
+        )
+
+    def prepare_extract(self, password: str, bit_length: Optional[int]) -> BlindExtractPlan:
+        """
+        Validate the password/bit_length once for a batch of extractions.
+        
+        Raises:
+            ValueError: If password is empty or bit_length is missing.
+        """
+        if not password:
+            raise ValueError("Password cannot be empty")
+
+        if bit_length is None:
+            raise ValueError(
+                "bit_length is required for extraction. "
+                "Use the bit_length returned from embed()."
+            )
+
+        return BlindExtractPlan(seed=self._password_to_seed(password), bit_length=bit_length)
+
     def embed(
             self,
             image_path: Union[str, Path],
@@ -253,49 +338,91 @@ class BlindWatermarkerAdapter:
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
-        if not password:
-            raise ValueError("Password cannot be empty")
+        return self.embed_with(self.prepare(password, text), image_path, output_path)
 
-        if not text:
-            raise ValueError("Watermark text cannot be empty")
+    def embed_with(
+            self,
+            plan: BlindEmbedPlan,
+            image_path: Union[str, Path],
+            output_path: Optional[Union[str, Path]] = None
+    ) -> Tuple[Path, int]:
+        """
+        Embed a prepared watermark into an image.
+        
+        Args:
+            plan: BlindEmbedPlan from prepare().
+            image_path: Path to the source image.
+            output_path: Path for output image. If None, auto-generated.
+            
+        Returns:
+            Tuple of (output_path, bit_length).
+            
+        Raises:
+            FileNotFoundError: If source image doesn't exist.
+            ValueError: If the text does not fit in the image.
+        """
+        image_path = Path(image_path)
+        if not image_path.exists():
+            raise FileNotFoundError(f"Image not found: {image_path}")
 
-        text_bytes = text.encode("utf-8")
-        if len(text_bytes) > self.MAX_TEXT_BYTES:
-            raise ValueError(
-                f"Text too long: {len(text_bytes)} bytes (max: {self.MAX_TEXT_BYTES})"
-            )
+        if output_path is None:
+            output_path = image_path.parent / f"{image_path.stem}_blind.png"
 
-        # Ensure PNG format
-        png_path = self._ensure_png_format(image_path)
+        return self._embed_array(plan, self._read_image(image_path), output_path)
 
+    def embed_image_with(
+            self,
+            plan: BlindEmbedPlan,
+            image: Image.Image,
+            output_path: Union[str, Path]
+    ) -> Tuple[Path, int]:
+        """
+        Embed a prepared watermark into an in-memory PIL image.
+        
+        Gives the same result as saving image as PNG and passing that file
+        to embed_with(), without the encode/decode round trip.
+        
+        Args:
+            plan: BlindEmbedPlan from prepare().
+            image: Source image (e.g. a visible watermark result).
+            output_path: Path for output image.
+            
+        Returns:
+            Tuple of (output_path, bit_length).
+            
+        Raises:
+            ValueError: If the text does not fit in the image.
+        """
+        return self._embed_array(plan, self._pil_to_array(image), output_path)
+
+    def _embed_array(
+            self,
+            plan: BlindEmbedPlan,
+            img: np.ndarray,
+            output_path: Union[str, Path]
+    ) -> Tuple[Path, int]:
+        """Embed plan into a decoded image array and write it to output_path."""
         # Check image capacity
-        max_text_len = self.get_max_text_length(png_path)
-        if len(text_bytes) > max_text_len:
+        max_text_len = self._max_text_length_for_capacity(self._image_capacity(img))
+        if plan.text_bytes > max_text_len:
             raise ValueError(
-                f"Text too long for this image: {len(text_bytes)} bytes "
+                f"Text too long for this image: {plan.text_bytes} bytes "
                 f"(image capacity: {max_text_len} bytes). "
                 "Use a larger image or shorter text."
             )
 
-        seed = self._password_to_seed(password)
-        bits = self._text_to_bits(text)
-        bit_length = len(bits)
-
-        if output_path is None:
-            output_path = image_path.parent / f"{image_path.stem}_blind.png"
-        else:
-            output_path = Path(output_path)
-            if output_path.suffix.lower() != ".png":
-                output_path = output_path.with_suffix(".png")
+        output_path = Path(output_path)
+        if output_path.suffix.lower() != ".png":
+            output_path = output_path.with_suffix(".png")
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        wm = WaterMark(password_img=seed, password_wm=seed)
-        wm.read_img(str(png_path))
-        wm.read_wm(bits, mode="bit")
+        wm = WaterMark(password_img=plan.seed, password_wm=plan.seed)
+        wm.read_img(img=img)
+        wm.read_wm(plan.bits, mode="bit")
         wm.embed(str(output_path))
 
-        return output_path, bit_length
+        return output_path, plan.bit_length
 
     def embed_to_image(
             self,
@@ -320,7 +447,7 @@ class BlindWatermarkerAdapter:
         try:
             if image.mode != "RGB":
                 image = image.convert("RGB")
-            image.save(temp_input, "PNG")
+            image.save(temp_input, "PNG", compress_level=self.PNG_COMPRESS_LEVEL)
 
             self.embed(temp_input, password, text, temp_output)
 
@@ -361,45 +488,53 @@ class BlindWatermarkerAdapter:
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
-        if not password:
-            raise ValueError("Password cannot be empty")
+        return self.extract_with(self.prepare_extract(password, bit_length), image_path)
 
-        if bit_length is None:
-            raise ValueError(
-                "bit_length is required for extraction. "
-                "Use the bit_length returned from embed()."
-            )
+    def extract_with(self, plan: BlindExtractPlan, image_path: Union[str, Path]) -> str:
+        """
+        Extract a watermark using a prepared plan.
+        
+        Args:
+            plan: BlindExtractPlan from prepare_extract().
+            image_path: Path to the watermarked image.
+            
+        Returns:
+            Extracted watermark text.
+            
+        Raises:
+            FileNotFoundError: If image doesn't exist.
+            ValueError: If extraction fails or data is corrupted.
+        """
+        image_path = Path(image_path)
+        if not image_path.exists():
+            raise FileNotFoundError(f"Image not found: {image_path}")
 
-        seed = self._password_to_seed(password)
-        png_path = self._ensure_png_format(image_path)
+        seed = plan.seed
+        bit_length = plan.bit_length
+        img = self._read_image(image_path, cv2.IMREAD_COLOR)
 
         # Verify bit_length doesn't exceed capacity
-        capacity = self._get_image_capacity(png_path)
+        capacity = self._image_capacity(img)
         if bit_length > capacity:
             raise ValueError(
                 f"bit_length ({bit_length}) exceeds image capacity ({capacity})"
             )
 
         wm = WaterMark(password_img=seed, password_wm=seed)
-        extracted_bits = wm.extract(str(png_path), wm_shape=bit_length, mode="bit")
+        extracted_bits = wm.extract(embed_img=img, wm_shape=bit_length, mode="bit")
 
         bits = np.array(extracted_bits).round().astype(np.uint8)
 
         return self._bits_to_text(bits)
 
     def cleanup(self):
-        """Clean up any temporary files created during processing."""
-        for temp_file in self._temp_files:
-            try:
-                if temp_file.exists():
-                    temp_file.unlink()
-            except OSError:
-                pass
-        self._temp_files.clear()
-
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        self.cleanup()
+        """
+        Release resources held between calls.
+        
+        Images are decoded in memory and embed_to_image removes its own
+        temporary files, so nothing is held; kept so callers can release
+        adapters uniformly.
+        """
 
 
 # Convenience functions
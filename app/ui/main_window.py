@@ -19,7 +19,7 @@ from PyQt6.QtWidgets import (
 
 from .tab_embed import EmbedTab
 from .tab_extract import ExtractTab
-from .widgets import get_mascot_path
+from .widgets import load_mascot_pixmap
 
 
 class MascotAvatarWidget(QWidget):
@@ -33,9 +33,7 @@ class MascotAvatarWidget(QWidget):
         self._load_mascot()
 
     def _load_mascot(self):
-        mascot_path = get_mascot_path()
-        if mascot_path.exists():
-            self._pixmap = QPixmap(str(mascot_path))
+        self._pixmap = load_mascot_pixmap()
 
     def paintEvent(self, event):
         painter = QPainter(self)
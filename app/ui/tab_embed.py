@@ -29,9 +29,9 @@ Design:
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QTimer
 from PyQt6.QtGui import (
     QWheelEvent, QPainter, QColor, QPen, QPixmap
 )
@@ -240,11 +240,27 @@ class EmbedTab(QWidget):
 
     start_embed_requested = pyqtSignal(dict)
 
+    # Images (besides the one being previewed) whose proxies are prepared
+    # in the background when the list changes; kept well inside the proxy
+    # cache budget so prewarming never evicts the current preview
+    PREWARM_IMAGE_LIMIT = 8
+    # The list can change several times in a row (dialog selections arrive
+    # in chunks), so prewarming waits until it has been quiet this long
+    PREWARM_DELAY_MS = 300
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         # V3.0: Reduced debounce to 50ms (safe with Proxy Pattern optimization)
         # The proxy image processing is now fast enough to handle 20 FPS updates
         self._preview_manager = PreviewManager(debounce_ms=50, parent=self)
+        # Images in the list as of the last change, to evict removed ones
+        self._known_images: Set[Path] = set()
+        # Image the last preview request was for
+        self._previewed_image: Optional[Path] = None
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.setInterval(self.PREWARM_DELAY_MS)
+        self._prewarm_timer.timeout.connect(self._prewarm_other_images)
         self._setup_ui()
         self._connect_signals()
 
@@ -760,7 +776,7 @@ class EmbedTab(QWidget):
         DEBOUNCE CHAIN:
         User drags slider → slider.valueChanged → spin.setValue
         → spin.valueChanged → _request_preview → PreviewManager.request_preview
-        → PreviewDebouncer (50ms) → PreviewWorker.start
+        → PreviewEngine (50ms trailing-edge debounce, latest wins) → render
         
         This ensures smooth UX even during rapid slider adjustments.
         """
@@ -772,11 +788,12 @@ class EmbedTab(QWidget):
 
         # Preview manager signals → UI updates
         self._preview_manager.preview_updated.connect(self._on_preview_updated)
+        self._preview_manager.preview_refining.connect(self._on_preview_refining)
         self._preview_manager.preview_error.connect(self._on_preview_error)
         self._preview_manager.preview_started.connect(self._on_preview_started)
 
         # === Visible watermark settings → preview ===
-        # All changes funnel through _request_preview → debouncer
+        # All changes funnel through _request_preview → engine debounce
         self.visible_enabled.toggled.connect(self._request_preview)
         self.visible_text.textChanged.connect(self._request_preview)
 
@@ -793,12 +810,36 @@ class EmbedTab(QWidget):
 
     def _on_images_changed(self, images):
         """Handle image list change (add/remove images)."""
-        self._preview_manager.clear_cache()
+        # Only removed images lose their cached proxies; the rest stay valid
+        current_images = set(images)
+        self._preview_manager.forget_images(self._known_images - current_images)
+        self._known_images = current_images
+
         if images:
-            self._request_preview()
+            # A dialog selection arrives in several chunks; only the first
+            # one changes which image is previewed
+            if self.image_list.get_selected_image() != self._previewed_image:
+                self._request_preview()
+            self._prewarm_timer.start()
         else:
+            self._prewarm_timer.stop()
+            self._previewed_image = None
             self.preview_canvas.clear()
 
+    def _prewarm_other_images(self):
+        """
+        Prewarm the proxies of the images other than the selected one.
+        
+        Switching the selection then shows a preview without the first-load
+        delay.
+        """
+        current = self.image_list.get_selected_image()
+        others = [path for path in self.image_list.get_images() if path != current]
+        self._preview_manager.prewarm(
+            self._build_preview_config(path)
+            for path in others[:self.PREWARM_IMAGE_LIMIT]
+        )
+
     def _on_selection_changed(self, selected_paths):
         """
         Handle image selection change in the list.
@@ -823,8 +864,13 @@ class EmbedTab(QWidget):
         if not selected_image:
             return
 
-        config = PreviewConfig(
-            image_path=selected_image,
+        self._previewed_image = selected_image
+        self._preview_manager.request_preview(self._build_preview_config(selected_image))
+
+    def _build_preview_config(self, image_path: Path) -> PreviewConfig:
+        """Preview config for image_path with the current watermark settings."""
+        return PreviewConfig(
+            image_path=image_path,
             visible_enabled=self.visible_enabled.isChecked(),
             visible_text=self.visible_text.text(),
             font_size=self.font_size_spin.value(),  # Original size (will be scaled)
@@ -833,11 +879,10 @@ class EmbedTab(QWidget):
             color=self.color_button.get_color(),
             spacing_h_ratio=self.spacing_h_spin.value(),  # Ratios don't need scaling
             spacing_v_ratio=self.spacing_v_spin.value(),
-            max_preview_size=800  # Proxy size limit for fast preview
+            max_preview_size=800,  # Proxy size limit for fast preview
+            progressive=True  # Quick coarse frame, then refine
         )
 
-        self._preview_manager.request_preview(config)
-
     def _on_preview_started(self):
         """Handle preview generation started."""
         self.preview_canvas.set_loading(True)
@@ -846,6 +891,10 @@ class EmbedTab(QWidget):
         self.preview_info.style().unpolish(self.preview_info)
         self.preview_info.style().polish(self.preview_info)
 
+    def _on_preview_refining(self, pixmap):
+        """Show the coarse frame while the full preview renders."""
+        self.preview_canvas.set_preview(pixmap)
+
     def _on_preview_updated(self, pixmap):
         """Handle preview updated."""
         self.preview_canvas.set_preview(pixmap)
@@ -16,15 +16,88 @@ Layout:
 from datetime import datetime
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap, QPainter, QPainterPath, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize, QThreadPool
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QImage, QPen
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QSpinBox, QPushButton,
-    QTextEdit, QFrame, QSplitter, QApplication
+    QPlainTextEdit, QFrame, QSplitter, QApplication
 )
 
 from .widgets import DragDropLabel, PasswordLineEdit, MascotStatus, get_mascot_path
+from ..workers.image_loader import ImageLoadTask
+
+
+def _minify_qss(qss: str) -> str:
+    """Collapse whitespace in a QSS literal."""
+    return " ".join(qss.split())
+
+
+# Stylesheets are minified once at import and shared by every instance
+_MASCOT_STATUS_QSS = _minify_qss("""
+    QLabel { font-size: 12px; font-weight: 600; }
+    QLabel[status="idle"] { color: #00D4FF; }
+    QLabel[status="processing"] { color: #8B5CF6; }
+    QLabel[status="complete"] { color: #10B981; }
+    QLabel[status="error"] { color: #EF4444; }
+""")
+
+_TERMINAL_QSS = _minify_qss("""
+    QPlainTextEdit {
+        background-color: #0D1117;
+        color: #00D4FF;
+        border: 1px solid #21262D;
+        border-radius: 8px;
+        padding: 12px;
+        font-family: "JetBrains Mono", "Fira Code", "Consolas", monospace;
+        font-size: 11px;
+        line-height: 1.4;
+    }
+""")
+_TERMINAL_SUCCESS_QSS = _TERMINAL_QSS.replace("#00D4FF", "#10B981").replace("#21262D", "#10B981")
+_TERMINAL_ERROR_QSS = _TERMINAL_QSS.replace("#00D4FF", "#EF4444").replace("#21262D", "#DC2626")
+
+_FILE_INFO_QSS = _minify_qss("""
+    color: #00D4FF;
+    background-color: rgba(0, 212, 255, 0.1);
+    border: 1px solid rgba(0, 212, 255, 0.3);
+    border-radius: 6px;
+    padding: 8px 14px;
+    font-size: 11px;
+""")
+
+_SETTINGS_FRAME_QSS = _minify_qss("""
+    QFrame {
+        background-color: #1E2025;
+        border: 1px solid #2E323B;
+        border-radius: 10px;
+    }
+""")
+
+_HEADER_QSS = "font-size: 14px; font-weight: 600; color: #F0F2F5;"
+_FIELD_LABEL_QSS = "color: #B0B8C4; font-size: 11px; font-weight: 500;"
+_RIGHT_PANEL_QSS = "background-color: #1A1D23;"
+_PLACEHOLDER_QSS = "font-size: 48px;"
+
+# Circular alpha masks keyed by size, rendered once and reused on every
+# status change instead of rebuilding a QPainterPath clip.
+_circle_masks: dict[int, QImage] = {}
+
+
+def _get_circle_mask(size: int) -> QImage:
+    """Get a cached white-on-transparent circle used as an alpha mask."""
+    mask = _circle_masks.get(size)
+    if mask is None:
+        mask = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        mask.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(mask)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(Qt.GlobalColor.white)
+        painter.drawEllipse(0, 0, size, size)
+        painter.end()
+        _circle_masks[size] = mask
+    return mask
 
 
 class MascotDisplay(QWidget):
@@ -37,6 +110,14 @@ class MascotDisplay(QWidget):
         MascotStatus.ERROR: ("😿", "失敗", "#EF4444"),
     }
 
+    # Border pens built once instead of parsing the hex color on every repaint
+    STATUS_PENS = {
+        status: QPen(QColor(color), 3)
+        for status, (_, _, color) in STATUS_DATA.items()
+    }
+
+    MASCOT_SIZE = 90  # V4.0: Adjusted size
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._status = MascotStatus.IDLE
@@ -54,34 +135,48 @@ class MascotDisplay(QWidget):
         # Mascot label - V4.0: Proper centering
         self.mascot_label = QLabel()
         self.mascot_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.mascot_label.setFixedSize(90, 90)
+        self.mascot_label.setFixedSize(self.MASCOT_SIZE, self.MASCOT_SIZE)
         layout.addWidget(self.mascot_label, 0, Qt.AlignmentFlag.AlignCenter)
 
         # Status label - V4.0: Proper centering and sizing
+        # Colors are keyed on the dynamic "status" property so a transition
+        # only needs a re-polish instead of a stylesheet reparse.
         self.status_label = QLabel("等待中")
-        self.status_label.setStyleSheet("color: #00D4FF; font-size: 12px; font-weight: 600;")
+        self.status_label.setStyleSheet(_MASCOT_STATUS_QSS)
+        self.status_label.setProperty("status", MascotStatus.IDLE.value)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setFixedHeight(22)
-        self.status_label.setMinimumWidth(90)
+        self.status_label.setMinimumWidth(self.MASCOT_SIZE)
         layout.addWidget(self.status_label, 0, Qt.AlignmentFlag.AlignCenter)
 
     def _load_mascot(self):
+        # Show the emoji placeholder until (or unless) the image is decoded
+        self.mascot_label.setText("🐱")
+        self.mascot_label.setStyleSheet(_PLACEHOLDER_QSS)
+
         path = get_mascot_path()
         if path.exists():
-            self._mascot_pixmap = QPixmap(str(path))
-            self._update_display()
-        else:
-            self.mascot_label.setText("🐱")
-            self.mascot_label.setStyleSheet("font-size: 48px;")
+            # Decode and smooth-scale once off the GUI thread;
+            # status changes only repaint the border
+            task = ImageLoadTask(
+                path,
+                QSize(self.MASCOT_SIZE, self.MASCOT_SIZE),
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding
+            )
+            task.signals.loaded.connect(self._on_mascot_loaded)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_mascot_loaded(self, _key, image: QImage):
+        if image.isNull():
+            return
+        self._mascot_pixmap = QPixmap.fromImage(image)
+        self._update_display()
 
     def _update_display(self):
         if not self._mascot_pixmap:
             return
 
-        size = 90  # V4.0: Adjusted size
-        scaled = self._mascot_pixmap.scaled(size, size,
-                                            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                            Qt.TransformationMode.SmoothTransformation)
+        size = self.MASCOT_SIZE
 
         circular = QPixmap(size, size)
         circular.fill(Qt.GlobalColor.transparent)
@@ -89,55 +184,51 @@ class MascotDisplay(QWidget):
         painter = QPainter(circular)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        path = QPainterPath()
-        path.addEllipse(0, 0, size, size)
-        painter.setClipPath(path)
-        painter.drawPixmap(0, 0, scaled)
+        painter.drawPixmap(0, 0, self._mascot_pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+        painter.drawImage(0, 0, _get_circle_mask(size))
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
 
         # Border - V4.0: Consistent sizing
-        _, _, color = self.STATUS_DATA.get(self._status, self.STATUS_DATA[MascotStatus.IDLE])
-        from PyQt6.QtGui import QPen
-        painter.setClipping(False)
-        painter.setPen(QPen(QColor(color), 3))
+        painter.setPen(self.STATUS_PENS[self._status])
         painter.drawEllipse(2, 2, size - 4, size - 4)
         painter.end()
 
         self.mascot_label.setPixmap(circular)
 
     def set_status(self, status: MascotStatus, text: str = ""):
+        # Normalise once so repaints can index STATUS_PENS directly
+        if status not in self.STATUS_DATA:
+            status = MascotStatus.IDLE
         self._status = status
-        icon, default_text, color = self.STATUS_DATA.get(status, self.STATUS_DATA[MascotStatus.IDLE])
+        _, default_text, _ = self.STATUS_DATA[status]
         self.status_label.setText(text or default_text)
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 12px; font-weight: 600;")
+        self.status_label.setProperty("status", status.value)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
         self._update_display()
 
 
-class TerminalOutput(QTextEdit):
+class TerminalOutput(QPlainTextEdit):
     """Terminal-style output."""
 
+    MAX_BLOCKS = 2000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
         self.setMinimumHeight(150)
+        # Appended blocks beyond the cap are dropped from the top
+        self.setMaximumBlockCount(self.MAX_BLOCKS)
         self._reset_style()
         self._show_welcome()
 
     def _reset_style(self):
-        self.setStyleSheet("""
-            QTextEdit {
-                background-color: #0D1117;
-                color: #00D4FF;
-                border: 1px solid #21262D;
-                border-radius: 8px;
-                padding: 12px;
-                font-family: "JetBrains Mono", "Fira Code", "Consolas", monospace;
-                font-size: 11px;
-                line-height: 1.4;
-            }
-        """)
+        self.setStyleSheet(_TERMINAL_QSS)
 
     def _show_welcome(self):
-        self.setPlainText("""╭────────────────────────────────╮
+        self.clear()
+        self.appendPlainText("""╭────────────────────────────────╮
 │   NightCat Watermark Extractor │
 ╰────────────────────────────────╯
 
@@ -145,14 +236,16 @@ class TerminalOutput(QTextEdit):
 
     def show_processing(self, filename: str):
         self._reset_style()
-        self.setPlainText(f"""[{self._ts()}] 開始解析: {filename}
+        self.clear()
+        self.appendPlainText(f"""[{self._ts()}] 開始解析: {filename}
 [{self._ts()}] 讀取頻域數據...
 [{self._ts()}] 嘗試解密...""")
 
     def show_result(self, text: str, success: bool):
+        self.clear()
         if success:
-            self.setStyleSheet(self.styleSheet().replace("#00D4FF", "#10B981").replace("#21262D", "#10B981"))
-            self.setPlainText(f"""╭────────────────────────────────╮
+            self.setStyleSheet(_TERMINAL_SUCCESS_QSS)
+            self.appendPlainText(f"""╭────────────────────────────────╮
 │       ✓ 提取成功               │
 ╰────────────────────────────────╯
 
@@ -163,8 +256,8 @@ class TerminalOutput(QTextEdit):
 
 [{self._ts()}] 完成""")
         else:
-            self.setStyleSheet(self.styleSheet().replace("#00D4FF", "#EF4444").replace("#21262D", "#DC2626"))
-            self.setPlainText(f"""╭────────────────────────────────╮
+            self.setStyleSheet(_TERMINAL_ERROR_QSS)
+            self.appendPlainText(f"""╭────────────────────────────────╮
 │       ✗ 提取失敗               │
 ╰────────────────────────────────╯
 
@@ -189,6 +282,7 @@ class ExtractTab(QWidget):
         super().__init__(parent)
         self._current_image = None
         self._extracted_text = ""
+        self._splitter_sized = False
         self._setup_ui()
         self._connect_signals()
 
@@ -199,6 +293,7 @@ class ExtractTab(QWidget):
 
         splitter = QSplitter(Qt.Orientation.Horizontal)
         splitter.setChildrenCollapsible(False)
+        self._splitter = splitter
 
         # Left panel
         left = self._create_left_panel()
@@ -208,9 +303,16 @@ class ExtractTab(QWidget):
         right = self._create_right_panel()
         splitter.addWidget(right)
 
-        splitter.setSizes([400, 600])
+        # Initial sizes are applied in showEvent, once the panels are polished,
+        # so the splitter does not rebalance them again on first show
         main_layout.addWidget(splitter)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._splitter_sized:
+            self._splitter_sized = True
+            self._splitter.setSizes([400, 600])
+
     def _create_left_panel(self):
         """Create left panel - V4.0: Fixed alignment, spacing, and unified sizes."""
         panel = QFrame()
@@ -224,27 +326,25 @@ class ExtractTab(QWidget):
 
         # Header - V4.0: Proper sizing
         header = QLabel("🔍 解析暗水印")
-        header.setStyleSheet("font-size: 14px; font-weight: 600; color: #F0F2F5;")
+        header.setStyleSheet(_HEADER_QSS)
         header.setFixedHeight(26)
         header.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         layout.addWidget(header)
 
         # Drop zone
-        self.drop_label = DragDropLabel(text="拖放圖片到這裡", show_mascot=False)
+        # Only one image is extracted, so the dialog picks a single file
+        self.drop_label = DragDropLabel(
+            text="拖放圖片到這裡",
+            show_mascot=False,
+            multi_select=False
+        )
         self.drop_label.setMinimumHeight(110)
         self.drop_label.setMaximumHeight(150)
         layout.addWidget(self.drop_label)
 
         # File info - V4.0: Consistent styling with unified height
         self.file_info = QLabel("")
-        self.file_info.setStyleSheet("""
-            color: #00D4FF;
-            background-color: rgba(0, 212, 255, 0.1);
-            border: 1px solid rgba(0, 212, 255, 0.3);
-            border-radius: 6px;
-            padding: 8px 14px;
-            font-size: 11px;
-        """)
+        self.file_info.setStyleSheet(_FILE_INFO_QSS)
         self.file_info.setVisible(False)
         self.file_info.setFixedHeight(34)  # V4.0: Unified height
         self.file_info.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -252,20 +352,14 @@ class ExtractTab(QWidget):
 
         # Settings frame
         settings_frame = QFrame()
-        settings_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1E2025;
-                border: 1px solid #2E323B;
-                border-radius: 10px;
-            }
-        """)
+        settings_frame.setStyleSheet(_SETTINGS_FRAME_QSS)
         settings_layout = QVBoxLayout(settings_frame)
         settings_layout.setContentsMargins(14, 14, 14, 14)
         settings_layout.setSpacing(12)
 
         # Password - V4.0: Proper label alignment
         pwd_label = QLabel("加密密碼")
-        pwd_label.setStyleSheet("color: #B0B8C4; font-size: 11px; font-weight: 500;")
+        pwd_label.setStyleSheet(_FIELD_LABEL_QSS)
         pwd_label.setFixedHeight(18)
         pwd_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         settings_layout.addWidget(pwd_label)
@@ -277,7 +371,7 @@ class ExtractTab(QWidget):
         bit_row.setSpacing(12)
         bit_row.setContentsMargins(0, 6, 0, 0)
         bit_label = QLabel("Bit Length")
-        bit_label.setStyleSheet("color: #B0B8C4; font-size: 11px; font-weight: 500;")
+        bit_label.setStyleSheet(_FIELD_LABEL_QSS)
         bit_label.setFixedHeight(18)
         bit_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         bit_row.addWidget(bit_label)
@@ -316,7 +410,7 @@ class ExtractTab(QWidget):
     def _create_right_panel(self):
         """Create right panel - V4.0: Fixed alignment and centering."""
         panel = QFrame()
-        panel.setStyleSheet("background-color: #1A1D23;")
+        panel.setStyleSheet(_RIGHT_PANEL_QSS)
         panel.setMinimumWidth(340)
 
         layout = QVBoxLayout(panel)
@@ -358,7 +452,13 @@ class ExtractTab(QWidget):
 
     def _connect_signals(self):
         self.drop_label.files_dropped.connect(self._on_files_dropped)
-        self.password_input.textChanged.connect(self._update_button)
+
+        # Coalesce keystrokes (or a long paste) into a single button re-eval
+        self._btn_timer = QTimer(self)
+        self._btn_timer.setSingleShot(True)
+        self._btn_timer.setInterval(0)
+        self._btn_timer.timeout.connect(self._update_button)
+        self.password_input.textChanged.connect(self._btn_timer.start)
 
     def _on_files_dropped(self, paths):
         if paths:
@@ -388,7 +488,11 @@ class ExtractTab(QWidget):
     def _update_button(self):
         has_image = self._current_image is not None
         has_pwd = bool(self.password_input.text().strip())
-        self.extract_btn.setEnabled(has_image and has_pwd)
+        enabled = has_image and has_pwd
+        # Compare with the button's own flag: isEnabled() (and WA_Disabled)
+        # also reflect disabled ancestors, WA_ForceDisabled does not
+        if enabled == self.extract_btn.testAttribute(Qt.WidgetAttribute.WA_ForceDisabled):
+            self.extract_btn.setEnabled(enabled)
 
     def _on_extract_clicked(self):
         if not self._current_image:
@@ -416,10 +520,11 @@ class ExtractTab(QWidget):
             self.mascot.set_status(MascotStatus.ERROR)
 
     def set_processing(self, is_processing: bool):
-        self.extract_btn.setEnabled(not is_processing)
+        enabled = not is_processing
+        for widget in (self.extract_btn, self.password_input, self.bit_length_spin):
+            if widget.testAttribute(Qt.WidgetAttribute.WA_ForceDisabled) == enabled:
+                widget.setEnabled(enabled)
         self.extract_btn.setText("⏳ 提取中..." if is_processing else "🔓 開始提取")
-        self.password_input.setEnabled(not is_processing)
-        self.bit_length_spin.setEnabled(not is_processing)
 
     def get_config(self):
         return {
@@ -12,23 +12,30 @@ Key Components:
 """
 
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QRectF
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QSize, QPoint, QPointF, QRect, QRectF, QThreadPool, QTimer, QUrl
+)
 from PyQt6.QtGui import (
-    QDragEnterEvent, QDropEvent, QPixmap, QIcon, QColor,
-    QPainter, QPainterPath, QBrush, QPen, QFont, QLinearGradient
+    QDragEnterEvent, QDropEvent, QImage, QPixmap, QIcon, QColor,
+    QPainter, QPainterPath, QBrush, QPen, QFont, QLinearGradient, QPixmapCache,
+    QStaticText, QTransform
 )
 from PyQt6.QtWidgets import (
     QLabel, QListWidget, QListWidgetItem, QLineEdit,
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QFileDialog, QAbstractItemView, QSizePolicy, QGraphicsDropShadowEffect
+    QFileDialog, QAbstractItemView, QSizePolicy
 )
 
+from ..workers.image_loader import ImageLoadTask
+
 
+@lru_cache(maxsize=1)
 def get_mascot_path() -> Path:
-    """Get the path to the mascot image."""
+    """Get the path to the mascot image (resolved once per process)."""
     # Try multiple possible locations
     possible_paths = [
         Path(__file__).parent / "assets" / "dark_watermarked_blind-200.png"
@@ -39,6 +46,45 @@ def get_mascot_path() -> Path:
     return possible_paths[0]  # Return default path even if not exists
 
 
+@lru_cache(maxsize=1)
+def load_mascot_pixmap() -> Optional[QPixmap]:
+    """
+    Load the full-size mascot pixmap, decoded once and shared.
+
+    QPixmap is implicitly shared, so every widget gets a cheap reference
+    to the same decoded image. Returns None if the asset is missing or
+    cannot be decoded. Requires a QApplication.
+    """
+    mascot_path = get_mascot_path()
+    if not mascot_path.exists():
+        return None
+    pixmap = QPixmap(str(mascot_path))
+    return None if pixmap.isNull() else pixmap
+
+
+def _paint_glow(painter: QPainter, rect: QRectF, radius: float, color: QColor, spread: int):
+    """
+    Paint a soft glow around a rounded rect.
+
+    Cheap stand-in for QGraphicsDropShadowEffect: concentric 1px rings
+    fading out over `spread` pixels, drawn once into a cached pixmap
+    rather than blurred on every repaint.
+    """
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    ring = QColor(color)
+    for i in range(1, spread + 1):
+        fade = 1.0 - i / (spread + 1)
+        ring.setAlpha(round(color.alpha() * fade * fade))
+        painter.setPen(QPen(ring, 1))
+        painter.drawRoundedRect(
+            rect.adjusted(-i + 0.5, -i + 0.5, i - 0.5, i - 0.5),
+            radius + i, radius + i
+        )
+    painter.restore()
+
+
 class MascotStatus(Enum):
     """Status states for the mascot widget."""
     IDLE = "idle"
@@ -75,13 +121,40 @@ class MascotStatusWidget(QWidget):
         MascotStatus.ERROR: "😿",
     }
 
+    # "{icon} {message}" per status, filled in after the class body
+    STATUS_LABELS: dict[MascotStatus, str] = {}
+
+    # Glow around the card (replaces a QGraphicsDropShadowEffect)
+    GLOW_COLOR = QColor(0, 180, 216, 40)
+    GLOW_SPREAD = 4
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self._status = MascotStatus.IDLE
+        # Status whose default label is currently shown (None while a custom
+        # message or the initial greeting is displayed)
+        self._label_status: Optional[MascotStatus] = None
+        # Mascot already scaled to cover _mascot_size (the full-resolution
+        # asset is not kept); the center crop happens when it is drawn
         self._mascot_pixmap: Optional[QPixmap] = None
         self._mascot_size = 80
 
+        # Circular mascot without border, and finished pixmaps per border color
+        self._base_circular: Optional[QPixmap] = None
+        self._composite_cache: dict[str, QPixmap] = {}
+
+        # Background paint objects (the gradient spans whatever rect it fills)
+        self._bg_gradient = QLinearGradient(0, 0, 0, 1)
+        self._bg_gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+        self._bg_gradient.setColorAt(0, QColor("#2A2D35"))
+        self._bg_gradient.setColorAt(1, QColor("#252830"))
+        self._border_pen = QPen(QColor("#353842"))
+        self._border_pen.setWidth(1)
+
+        # Glow halo around the card, rebuilt only on resize
+        self._halo: Optional[QPixmap] = None
+
         self._setup_ui()
         self._load_mascot()
 
@@ -117,18 +190,12 @@ class MascotStatusWidget(QWidget):
         """)
         layout.addWidget(self.status_label)
 
-        # Add glow effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 180, 216, 40))
-        shadow.setOffset(0, 0)
-        self.setGraphicsEffect(shadow)
-
     def _load_mascot(self):
         """Load and display the mascot image."""
-        mascot_path = get_mascot_path()
-        if mascot_path.exists():
-            self._mascot_pixmap = QPixmap(str(mascot_path))
+        mascot = load_mascot_pixmap()
+        if mascot is not None:
+            self._mascot_pixmap = self._scale_mascot(mascot)
+            self._build_base_circular()
             self._update_mascot_display()
         else:
             # Fallback to emoji if image not found
@@ -141,25 +208,23 @@ class MascotStatusWidget(QWidget):
                 }
             """)
 
-    def _update_mascot_display(self):
-        """Update the mascot display with circular crop."""
-        if self._mascot_pixmap is None or self._mascot_pixmap.isNull():
-            return
+    def _scale_mascot(self, raw: QPixmap) -> Optional[QPixmap]:
+        """Scale the mascot so it covers a _mascot_size square."""
+        if raw.isNull():
+            return None
 
-        # Scale mascot
-        scaled = self._mascot_pixmap.scaled(
+        return raw.scaled(
             self._mascot_size, self._mascot_size,
             Qt.AspectRatioMode.KeepAspectRatioByExpanding,
             Qt.TransformationMode.SmoothTransformation
         )
 
-        # Center crop to square
-        if scaled.width() > self._mascot_size:
-            x_offset = (scaled.width() - self._mascot_size) // 2
-            scaled = scaled.copy(x_offset, 0, self._mascot_size, self._mascot_size)
-        if scaled.height() > self._mascot_size:
-            y_offset = (scaled.height() - self._mascot_size) // 2
-            scaled = scaled.copy(0, y_offset, self._mascot_size, self._mascot_size)
+    def _build_base_circular(self):
+        """Build the circular mascot (no border) from the scaled pixmap."""
+        self._base_circular = None
+        self._composite_cache.clear()
+        if self._mascot_pixmap is None:
+            return
 
         # Create circular mask
         circular = QPixmap(self._mascot_size, self._mascot_size)
@@ -172,20 +237,45 @@ class MascotStatusWidget(QWidget):
         path = QPainterPath()
         path.addEllipse(0, 0, self._mascot_size, self._mascot_size)
         painter.setClipPath(path)
-        painter.drawPixmap(0, 0, scaled)
 
-        # Draw border based on status
-        border_color = self._get_status_color()
-        pen = QPen(QColor(border_color))
+        # Center crop via the source rect (no intermediate copy)
+        size = self._mascot_size
+        sx = max(0, (self._mascot_pixmap.width() - size) // 2)
+        sy = max(0, (self._mascot_pixmap.height() - size) // 2)
+        painter.drawPixmap(0, 0, size, size, self._mascot_pixmap, sx, sy, size, size)
+        painter.end()
+
+        self._base_circular = circular
+
+    def _render_border(self, color: str) -> QPixmap:
+        """Stroke the status border onto a copy of the base circular mascot."""
+        composite = QPixmap(self._base_circular)
+
+        painter = QPainter(composite)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen(QColor(color))
         pen.setWidth(3)
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.setClipping(False)
         painter.drawEllipse(1, 1, self._mascot_size - 2, self._mascot_size - 2)
-
         painter.end()
 
-        self.mascot_label.setPixmap(circular)
+        return composite
+
+    def _update_mascot_display(self):
+        """Show the cached mascot composite for the current status color."""
+        if self._base_circular is None:
+            return
+
+        # Only the border color differs between states, so at most one
+        # composite per MascotStatus is ever rendered
+        border_color = self._get_status_color()
+        composite = self._composite_cache.get(border_color)
+        if composite is None:
+            composite = self._render_border(border_color)
+            self._composite_cache[border_color] = composite
+
+        self.mascot_label.setPixmap(composite)
 
     def _get_status_color(self) -> str:
         """Get the border color for current status."""
@@ -206,45 +296,84 @@ class MascotStatusWidget(QWidget):
             status: The new status.
             custom_message: Optional custom message to display.
         """
+        # Repeated default updates (e.g. IDLE from every worker) are no-ops
+        if not custom_message and status == self._label_status:
+            return
+
+        # Text-only updates (same status, new message) keep the mascot pixmap
+        status_changed = status != self._status
         self._status = status
 
         # Update status text
-        message = custom_message or self.STATUS_MESSAGES.get(status, "")
-        icon = self.STATUS_ICONS.get(status, "")
-        self.status_label.setText(f"{icon} {message}")
+        if custom_message:
+            icon = self.STATUS_ICONS.get(status, "")
+            self.status_label.setText(f"{icon} {custom_message}")
+            self._label_status = None
+        else:
+            self.status_label.setText(self.STATUS_LABELS[status])
+            self._label_status = status
 
         # Update border color
-        self._update_mascot_display()
+        if status_changed:
+            self._update_mascot_display()
 
     def get_status(self) -> MascotStatus:
         """Get the current status."""
         return self._status
 
+    def _make_halo(self) -> QPixmap:
+        """Render the glow halo for the current size."""
+        dpr = self.devicePixelRatioF()
+        halo = QPixmap(self.size() * dpr)
+        halo.setDevicePixelRatio(dpr)
+        halo.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(halo)
+        card = QRectF(self.rect()).adjusted(
+            self.GLOW_SPREAD, self.GLOW_SPREAD, -self.GLOW_SPREAD, -self.GLOW_SPREAD
+        )
+        _paint_glow(painter, card, 12, self.GLOW_COLOR, self.GLOW_SPREAD)
+        painter.end()
+
+        return halo
+
+    def resizeEvent(self, event):
+        """Drop the cached halo on resize."""
+        self._halo = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         """Custom paint for background."""
+        if self._halo is None:
+            self._halo = self._make_halo()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._halo)
 
-        rect = self.rect()
+        # The card is inset so the halo has room inside the widget
+        rect = QRectF(self.rect()).adjusted(
+            self.GLOW_SPREAD, self.GLOW_SPREAD, -self.GLOW_SPREAD, -self.GLOW_SPREAD
+        )
 
         # Draw rounded background
         path = QPainterPath()
-        path.addRoundedRect(QRectF(rect), 12, 12)
-
-        gradient = QLinearGradient(0, 0, 0, rect.height())
-        gradient.setColorAt(0, QColor("#2A2D35"))
-        gradient.setColorAt(1, QColor("#252830"))
-        painter.fillPath(path, gradient)
+        path.addRoundedRect(rect, 12, 12)
+        painter.fillPath(path, QBrush(self._bg_gradient))
 
         # Draw subtle border
-        pen = QPen(QColor("#353842"))
-        pen.setWidth(1)
-        painter.setPen(pen)
-        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+        painter.setPen(self._border_pen)
+        painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
 
         painter.end()
 
 
+MascotStatusWidget.STATUS_LABELS.update({
+    status: f"{MascotStatusWidget.STATUS_ICONS[status]} {MascotStatusWidget.STATUS_MESSAGES[status]}"
+    for status in MascotStatus
+})
+
+
 class PreviewWidget(QWidget):
     """
     Widget for displaying real-time watermark preview.
@@ -253,6 +382,8 @@ class PreviewWidget(QWidget):
     and error states.
     """
 
+    RESIZE_DEBOUNCE_MS = 60
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
@@ -260,6 +391,17 @@ class PreviewWidget(QWidget):
         self._is_loading = False
         self._error_message: Optional[str] = None
 
+        # Last smooth-scaled pixmap, keyed by (source cacheKey, width, height)
+        self._scaled_cache_key: Optional[tuple] = None
+        self._scaled_cache: Optional[QPixmap] = None
+
+        # Smooth rescale only once a resize drag settles; restarting the
+        # single-shot timer coalesces every resize event inside the window
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -279,31 +421,64 @@ class PreviewWidget(QWidget):
             QSizePolicy.Policy.Expanding
         )
         self.preview_label.setObjectName("previewLabel")
-        layout.addWidget(self.preview_label)
-
-        # Set initial state
-        self._show_placeholder()
 
-    def _show_placeholder(self):
-        """Show placeholder when no image is loaded."""
-        self.preview_label.setText("📷 選擇圖片後將在此顯示預覽")
+        # One stylesheet for every state; transitions only flip the
+        # "state" property instead of re-parsing a new stylesheet
         self.preview_label.setStyleSheet("""
             QLabel#previewLabel {
+                background-color: #1E2025;
+                border-radius: 12px;
+            }
+            QLabel#previewLabel[state="placeholder"] {
                 color: #6B7280;
                 font-size: 14px;
-                background-color: #1E2025;
                 border: 2px dashed #353842;
-                border-radius: 12px;
+            }
+            QLabel#previewLabel[state="loading"] {
+                color: #00B4D8;
+                font-size: 14px;
+                border: 2px solid #00B4D8;
+            }
+            QLabel#previewLabel[state="error"] {
+                color: #EF4444;
+                font-size: 13px;
+                border: 2px solid #DC2626;
+                padding: 20px;
+            }
+            QLabel#previewLabel[state="image"] {
+                border: 2px solid #353842;
+                padding: 10px;
             }
         """)
+        layout.addWidget(self.preview_label)
+
+        # Set initial state
+        self._show_placeholder()
+
+    def _set_state(self, state: str):
+        """Switch the label's styling state (re-polish only on change)."""
+        if self.preview_label.property("state") == state:
+            return
+        self.preview_label.setProperty("state", state)
+        self.preview_label.style().unpolish(self.preview_label)
+        self.preview_label.style().polish(self.preview_label)
+
+    def _show_placeholder(self):
+        """Show placeholder when no image is loaded."""
+        self.preview_label.setText("📷 選擇圖片後將在此顯示預覽")
+        self._set_state("placeholder")
 
-    def set_preview(self, pixmap: QPixmap):
+    def set_preview(self, pixmap: Union[QPixmap, QImage]):
         """
         Set the preview image.
         
         Args:
-            pixmap: QPixmap to display.
+            pixmap: QPixmap to display. A QImage is converted with
+                    QPixmap.fromImage (the QPixmap(QImage) constructor is
+                    a slower binding-side emulation).
         """
+        if isinstance(pixmap, QImage):
+            pixmap = QPixmap.fromImage(pixmap)
         self._pixmap = pixmap
         self._is_loading = False
         self._error_message = None
@@ -319,15 +494,7 @@ class PreviewWidget(QWidget):
         self._is_loading = is_loading
         if is_loading:
             self.preview_label.setText("⏳ 正在生成預覽...")
-            self.preview_label.setStyleSheet("""
-                QLabel#previewLabel {
-                    color: #00B4D8;
-                    font-size: 14px;
-                    background-color: #1E2025;
-                    border: 2px solid #00B4D8;
-                    border-radius: 12px;
-                }
-            """)
+            self._set_state("loading")
 
     def set_error(self, message: str):
         """
@@ -339,20 +506,13 @@ class PreviewWidget(QWidget):
         self._error_message = message
         self._is_loading = False
         self.preview_label.setText(f"❌ {message}")
-        self.preview_label.setStyleSheet("""
-            QLabel#previewLabel {
-                color: #EF4444;
-                font-size: 13px;
-                background-color: #1E2025;
-                border: 2px solid #DC2626;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        self._set_state("error")
 
     def clear(self):
         """Clear the preview."""
         self._pixmap = None
+        self._scaled_cache_key = None
+        self._scaled_cache = None
         self._is_loading = False
         self._error_message = None
         self._show_placeholder()
@@ -364,26 +524,42 @@ class PreviewWidget(QWidget):
             return
 
         # Scale pixmap to fit widget while maintaining aspect ratio
-        scaled = self._pixmap.scaled(
-            self.preview_label.size() - QSize(20, 20),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        # (cacheKey changes whenever the source pixmap changes)
+        target = self.preview_label.size() - QSize(20, 20)
+        key = (self._pixmap.cacheKey(), target.width(), target.height())
+        if key != self._scaled_cache_key:
+            self._scaled_cache = self._pixmap.scaled(
+                target,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._scaled_cache_key = key
 
-        self.preview_label.setPixmap(scaled)
-        self.preview_label.setStyleSheet("""
-            QLabel#previewLabel {
-                background-color: #1E2025;
-                border: 2px solid #353842;
-                border-radius: 12px;
-                padding: 10px;
-            }
-        """)
+        self.preview_label.setPixmap(self._scaled_cache)
+        self._set_state("image")
+
+    def _showing_image(self) -> bool:
+        """Whether the label currently displays the preview pixmap."""
+        return (
+            self._pixmap is not None and not self._pixmap.isNull()
+            and not self._is_loading and not self._error_message
+        )
 
     def resizeEvent(self, event):
-        """Handle resize to update preview scaling."""
+        """Handle resize with a fast rescale; the smooth one is debounced."""
         super().resizeEvent(event)
-        if self._pixmap and not self._is_loading and not self._error_message:
+        if self._showing_image():
+            fast = self._pixmap.scaled(
+                self.preview_label.size() - QSize(20, 20),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation
+            )
+            self.preview_label.setPixmap(fast)
+            self._resize_timer.start()
+
+    def _on_resize_settled(self):
+        """Do the smooth rescale for the final size."""
+        if self._showing_image():
             self._update_display()
 
 
@@ -394,6 +570,12 @@ class DragDropLabel(QLabel):
     Displays a drop zone with visual feedback when files are dragged over.
     Compact design without mascot (mascot is now in separate widget).
     
+    With multi_select (the default) the file dialog accepts several files
+    and emits the selection in FILE_DIALOG_CHUNK-sized pieces, for
+    listeners that add files incrementally. Listeners that only use one
+    file should pass multi_select=False: the dialog then picks a single
+    file, emitted in one call.
+    
     Signals:
         files_dropped(list[Path]): Emitted when files are dropped.
     """
@@ -402,26 +584,76 @@ class DragDropLabel(QLabel):
 
     # Supported image formats
     SUPPORTED_FORMATS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp", ".tiff"}
+    # Tuple form for str.endswith checks on raw paths (no Path allocation)
+    SUPPORTED_FORMATS_TUPLE = tuple(sorted(SUPPORTED_FORMATS))
+
+    # File dialog filter, built once
+    _FILTER_STR = (
+        "圖片檔案 (" + " ".join(f"*{fmt}" for fmt in SUPPORTED_FORMATS_TUPLE)
+        + ");;所有檔案 (*.*)"
+    )
+
+    # Dialog selections are emitted in chunks of this many paths
+    FILE_DIALOG_CHUNK = 16
 
     # Color scheme
     ACCENT_COLOR = "#00B4D8"
     BG_COLOR = "#2A2D35"
     BORDER_COLOR = "#4B5563"
     TEXT_COLOR = "#B0B8C4"
+    GLOW_COLOR = QColor(0, 180, 216, 20)
+
+    # Hint fonts, built once on first use (QFont needs a QGuiApplication)
+    _HINT_FONT: Optional[QFont] = None
+    _SUB_FONT: Optional[QFont] = None
+
+    @classmethod
+    def _ensure_fonts(cls):
+        """Build the shared hint fonts."""
+        if cls._HINT_FONT is None:
+            hint_font = QFont("Microsoft YaHei UI")
+            hint_font.setPointSize(11)
+            hint_font.setWeight(QFont.Weight.Medium)
+            cls._HINT_FONT = hint_font
+
+            sub_font = QFont("Microsoft YaHei UI")
+            sub_font.setPointSize(9)
+            sub_font.setWeight(QFont.Weight.Normal)
+            cls._SUB_FONT = sub_font
+
+    @staticmethod
+    def _make_static_text(text: str, font: QFont) -> QStaticText:
+        """Build a QStaticText with its glyph layout prepared for font."""
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        static.prepare(QTransform(), font)
+        return static
 
     def __init__(
             self,
             text: str = "把圖片拖過來給我吧～",
             show_mascot: bool = False,  # Default to False now
+            multi_select: bool = True,
             parent: Optional[QWidget] = None
     ):
         super().__init__(parent)
 
         self._hint_text = text
         self._show_mascot = show_mascot
+        self._multi_select = multi_select
         self._is_dragging = False
         self._mascot_pixmap: Optional[QPixmap] = None
 
+        # Rendered drop zone per (width, height, dragging)
+        self._bg_cache: Dict[tuple, QPixmap] = {}
+        self._ensure_fonts()
+        self._setup_paint_objects()
+
+        # Pre-laid-out hint texts
+        self._hint_static = self._make_static_text(text, self._HINT_FONT)
+        self._drag_static = self._make_static_text("鬆開滑鼠放下圖片 ✨", self._HINT_FONT)
+        self._sub_static = self._make_static_text("PNG, JPG, WEBP 等格式", self._SUB_FONT)
+
         self.setAcceptDrops(True)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setMinimumSize(200, 100)
@@ -434,61 +666,92 @@ class DragDropLabel(QLabel):
         if self._show_mascot:
             self._load_mascot()
 
-        # Add subtle glow effect
-        self._setup_effects()
-
     def _load_mascot(self):
         """Load the mascot image."""
-        mascot_path = get_mascot_path()
-        if mascot_path.exists():
-            self._mascot_pixmap = QPixmap(str(mascot_path))
-        else:
-            self._mascot_pixmap = None
+        self._mascot_pixmap = load_mascot_pixmap()
 
-    def _setup_effects(self):
-        """Setup visual effects."""
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 180, 216, 20))
-        shadow.setOffset(0, 0)
-        self.setGraphicsEffect(shadow)
+    def _setup_paint_objects(self):
+        """Build the colors and pens used by _paint_drop_zone, keyed by dragging."""
+        self._accent_color = QColor(self.ACCENT_COLOR)
+        self._text_color = QColor(self.TEXT_COLOR)
+        self._sub_color = QColor("#6B7280")
+
+        self._gradient_stops = {
+            True: (QColor("#1E3A4A"), QColor("#152535")),
+            False: (QColor("#2A2D35"), QColor("#252830")),
+        }
+
+        self._border_pens = {}
+        for dragging, color in ((True, self._accent_color), (False, QColor(self.BORDER_COLOR))):
+            pen = QPen(color)
+            pen.setStyle(Qt.PenStyle.DashLine)
+            pen.setWidth(2)
+            pen.setDashPattern([6, 4])
+            self._border_pens[dragging] = pen
+
+        self._arrow_pens = {
+            True: QPen(self._accent_color, 2),
+            False: QPen(self._sub_color, 2),
+        }
 
     def paintEvent(self, event):
-        """Custom paint for the drop zone - V4.1 Fixed Layout."""
+        """Blit the cached drop zone for the current size and drag state."""
+        key = (self.width(), self.height(), self._is_dragging)
+        pixmap = self._bg_cache.get(key)
+        if pixmap is None:
+            # Two sizes x two drag states is plenty
+            if len(self._bg_cache) >= 4:
+                self._bg_cache.clear()
+            pixmap = self._render_to_pixmap(self.size(), self._is_dragging)
+            self._bg_cache[key] = pixmap
+
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+
+    def resizeEvent(self, event):
+        """Drop cached renders on resize."""
+        self._bg_cache.clear()
+        super().resizeEvent(event)
+
+    def _render_to_pixmap(self, size: QSize, dragging: bool) -> QPixmap:
+        """Render the drop zone onto an offscreen pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        self._paint_drop_zone(painter, QRect(QPoint(0, 0), size), dragging)
+        painter.end()
+
+        return pixmap
+
+    def _paint_drop_zone(self, painter: QPainter, rect: QRect, dragging: bool):
+        """Paint the drop zone - V4.1 Fixed Layout."""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
-        rect = self.rect()
         margin = 4
 
+        # Subtle glow in the margin (baked into the cached render)
+        zone = QRectF(rect).adjusted(margin, margin, -margin, -margin)
+        _paint_glow(painter, zone, 10, self.GLOW_COLOR, margin)
+
         # Draw background with rounded corners
         path = QPainterPath()
-        path.addRoundedRect(QRectF(rect).adjusted(margin, margin, -margin, -margin), 10, 10)
+        path.addRoundedRect(zone, 10, 10)
 
         # Background gradient
+        top_color, bottom_color = self._gradient_stops[dragging]
         gradient = QLinearGradient(0, 0, 0, rect.height())
-        if self._is_dragging:
-            gradient.setColorAt(0, QColor("#1E3A4A"))
-            gradient.setColorAt(1, QColor("#152535"))
-        else:
-            gradient.setColorAt(0, QColor("#2A2D35"))
-            gradient.setColorAt(1, QColor("#252830"))
+        gradient.setColorAt(0, top_color)
+        gradient.setColorAt(1, bottom_color)
 
         painter.fillPath(path, QBrush(gradient))
 
         # Draw dashed border
-        pen = QPen()
-        pen.setStyle(Qt.PenStyle.DashLine)
-        pen.setWidth(2)
-        pen.setDashPattern([6, 4])
-
-        if self._is_dragging:
-            pen.setColor(QColor(self.ACCENT_COLOR))
-        else:
-            pen.setColor(QColor(self.BORDER_COLOR))
-
-        painter.setPen(pen)
+        painter.setPen(self._border_pens[dragging])
         painter.drawRoundedRect(QRectF(rect).adjusted(margin + 1, margin + 1, -margin - 1, -margin - 1), 9, 9)
 
         # Calculate content area
@@ -501,8 +764,7 @@ class DragDropLabel(QLabel):
         start_y = content_rect.top() + (content_height - total_content_height) // 2
 
         # Draw upload arrow icon
-        icon_color = QColor(self.ACCENT_COLOR if self._is_dragging else "#6B7280")
-        painter.setPen(QPen(icon_color, 2))
+        painter.setPen(self._arrow_pens[dragging])
 
         center_x = content_rect.center().x()
         arrow_top = start_y
@@ -515,35 +777,25 @@ class DragDropLabel(QLabel):
 
         # Draw main hint text
         text_y = arrow_top + arrow_size + 8
-        
-        font = QFont()
-        font.setFamily("Microsoft YaHei UI")
-        font.setPointSize(11)
-        font.setWeight(QFont.Weight.Medium)
-        painter.setFont(font)
-
-        if self._is_dragging:
-            painter.setPen(QColor(self.ACCENT_COLOR))
-            hint = "鬆開滑鼠放下圖片 ✨"
+        painter.setFont(self._HINT_FONT)
+
+        if dragging:
+            painter.setPen(self._accent_color)
+            hint = self._drag_static
         else:
-            painter.setPen(QColor(self.TEXT_COLOR))
-            hint = self._hint_text
+            painter.setPen(self._text_color)
+            hint = self._hint_static
 
-        text_rect = QRectF(content_rect.left(), text_y, content_width, 20)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, hint)
+        hint_x = content_rect.left() + (content_width - hint.size().width()) / 2
+        painter.drawStaticText(QPointF(hint_x, text_y), hint)
 
         # Draw secondary hint
         sub_y = text_y + 20
-        font.setPointSize(9)
-        font.setWeight(QFont.Weight.Normal)
-        painter.setFont(font)
-        painter.setPen(QColor("#6B7280"))
+        painter.setFont(self._SUB_FONT)
+        painter.setPen(self._sub_color)
 
-        sub_hint = "PNG, JPG, WEBP 等格式"
-        sub_rect = QRectF(content_rect.left(), sub_y, content_width, 16)
-        painter.drawText(sub_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, sub_hint)
-
-        painter.end()
+        sub_x = content_rect.left() + (content_width - self._sub_static.size().width()) / 2
+        painter.drawStaticText(QPointF(sub_x, sub_y), self._sub_static)
 
     def mousePressEvent(self, event):
         """Handle mouse click to open file dialog."""
@@ -553,25 +805,29 @@ class DragDropLabel(QLabel):
 
     def _open_file_dialog(self):
         """Open file dialog to select images."""
-        formats = " ".join(f"*{fmt}" for fmt in self.SUPPORTED_FORMATS)
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "選擇圖片",
-            "",
-            f"圖片檔案 ({formats});;所有檔案 (*.*)"
-        )
+        if not self._multi_select:
+            url, _ = QFileDialog.getOpenFileUrl(self, "選擇圖片", QUrl(), self._FILTER_STR)
+            if url.isLocalFile():
+                self.files_dropped.emit([Path(url.toLocalFile())])
+            return
 
-        if files:
-            paths = [Path(f) for f in files]
-            self.files_dropped.emit(paths)
+        urls, _ = QFileDialog.getOpenFileUrls(self, "選擇圖片", QUrl(), self._FILTER_STR)
+
+        paths = [Path(url.toLocalFile()) for url in urls if url.isLocalFile()]
+
+        # Emit in chunks from the event loop so listeners can start on the
+        # first files (e.g. thumbnails) before the whole selection is queued
+        for start in range(0, len(paths), self.FILE_DIALOG_CHUNK):
+            chunk = paths[start:start + self.FILE_DIALOG_CHUNK]
+            QTimer.singleShot(0, lambda c=chunk: self.files_dropped.emit(c))
 
     def dragEnterEvent(self, event: QDragEnterEvent):
-        """Handle drag enter event."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
+        """Handle drag enter event (accept on the first supported file)."""
+        mime_data = event.mimeData()
+        if mime_data.hasUrls():
+            for url in mime_data.urls():
                 if url.isLocalFile():
-                    path = Path(url.toLocalFile())
-                    if path.suffix.lower() in self.SUPPORTED_FORMATS:
+                    if url.toLocalFile().lower().endswith(self.SUPPORTED_FORMATS_TUPLE):
                         event.acceptProposedAction()
                         self._is_dragging = True
                         self.update()
@@ -592,9 +848,9 @@ class DragDropLabel(QLabel):
         paths: List[Path] = []
         for url in event.mimeData().urls():
             if url.isLocalFile():
-                path = Path(url.toLocalFile())
-                if path.suffix.lower() in self.SUPPORTED_FORMATS:
-                    paths.append(path)
+                local_file = url.toLocalFile()
+                if local_file.lower().endswith(self.SUPPORTED_FORMATS_TUPLE):
+                    paths.append(Path(local_file))
 
         if paths:
             self.files_dropped.emit(paths)
@@ -603,6 +859,8 @@ class DragDropLabel(QLabel):
     def set_hint_text(self, text: str):
         """Update the hint text."""
         self._hint_text = text
+        self._hint_static = self._make_static_text(text, self._HINT_FONT)
+        self._bg_cache.clear()
         self.update()
 
 
@@ -623,11 +881,23 @@ class ImageListWidget(QWidget):
     selection_changed = pyqtSignal(list)  # List[Path]
 
     THUMBNAIL_SIZE = 48
+    THUMBNAIL_CACHE_KB = 40960  # QPixmapCache budget (40 MB)
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
+        # Re-adding a path hits the cache instead of decoding the file again
+        QPixmapCache.setCacheLimit(self.THUMBNAIL_CACHE_KB)
+
+        # Ordered paths, plus a path -> item index for O(1) membership
         self._image_paths: List[Path] = []
+        self._items: Dict[Path, QListWidgetItem] = {}
+
+        # Shown until the background thumbnail decode finishes
+        placeholder = QPixmap(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
+        placeholder.fill(QColor("#353842"))
+        self._placeholder_icon = QIcon(placeholder)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -693,35 +963,64 @@ class ImageListWidget(QWidget):
 
         layout.addLayout(btn_layout)
 
+    def _thumbnail_key(self, image_path: Path) -> str:
+        """QPixmapCache key for an image thumbnail."""
+        return f"thumb::{self.THUMBNAIL_SIZE}::{image_path}"
+
     def _create_thumbnail(self, image_path: Path) -> QIcon:
-        """Create a thumbnail icon for an image."""
-        pixmap = QPixmap(str(image_path))
-        if pixmap.isNull():
-            # Create placeholder
-            pixmap = QPixmap(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
-            pixmap.fill(QColor("#353842"))
-        else:
-            pixmap = pixmap.scaled(
-                self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        return QIcon(pixmap)
+        """
+        Get the thumbnail icon for an image.
 
-    def add_images(self, paths: List[Path]):
-        """Add images to the list."""
-        for path in paths:
-            if path not in self._image_paths:
-                self._image_paths.append(path)
+        Returns the cached thumbnail if available. Otherwise queues a
+        background decode and returns the placeholder icon; the item icon
+        is replaced in _on_thumbnail_loaded.
+        """
+        pixmap = QPixmapCache.find(self._thumbnail_key(image_path))
+        if pixmap is not None:
+            return QIcon(pixmap)
+
+        size = QSize(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
+        task = ImageLoadTask(image_path, size)
+        task.signals.loaded.connect(self._on_thumbnail_loaded)
+        QThreadPool.globalInstance().start(task)
+        return self._placeholder_icon
+
+    def _on_thumbnail_loaded(self, image_path: Path, image):
+        """Install a thumbnail decoded by ImageLoadTask."""
+        if image.isNull():
+            return  # Keep the placeholder
 
-                item = QListWidgetItem()
-                item.setText(path.name)
-                item.setToolTip(str(path))
-                item.setIcon(self._create_thumbnail(path))
-                item.setData(Qt.ItemDataRole.UserRole, path)
-                item.setSizeHint(QSize(-1, self.THUMBNAIL_SIZE + 8))
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._thumbnail_key(image_path), pixmap)
 
-                self.list_widget.addItem(item)
+        # The image may have been removed while it was decoding
+        item = self._items.get(image_path)
+        if item is not None:
+            item.setIcon(QIcon(pixmap))
+
+    def add_images(self, paths: List[Path]):
+        """Add images to the list."""
+        # Batch the inserts: one repaint instead of one per item
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            for path in paths:
+                if path not in self._items:
+                    self._image_paths.append(path)
+
+                    item = QListWidgetItem()
+                    item.setText(path.name)
+                    item.setToolTip(str(path))
+                    item.setData(Qt.ItemDataRole.UserRole, path)
+                    item.setSizeHint(QSize(-1, self.THUMBNAIL_SIZE + 8))
+
+                    self._items[path] = item
+                    item.setIcon(self._create_thumbnail(path))
+                    self.list_widget.addItem(item)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
+        self.list_widget.viewport().update()
 
         self._update_ui_state()
         self.images_changed.emit(self._image_paths.copy())
@@ -731,16 +1030,20 @@ class ImageListWidget(QWidget):
         selected_items = self.list_widget.selectedItems()
         for item in selected_items:
             path = item.data(Qt.ItemDataRole.UserRole)
-            if path in self._image_paths:
-                self._image_paths.remove(path)
+            self._items.pop(path, None)
             self.list_widget.takeItem(self.list_widget.row(item))
 
+        # Single O(N) pass instead of a list.remove per selected item
+        if selected_items:
+            self._image_paths = [p for p in self._image_paths if p in self._items]
+
         self._update_ui_state()
         self.images_changed.emit(self._image_paths.copy())
 
     def clear_images(self):
         """Clear all images from the list."""
         self._image_paths.clear()
+        self._items.clear()
         self.list_widget.clear()
         self._update_ui_state()
         self.images_changed.emit(self._image_paths.copy())
@@ -9,14 +9,19 @@ Components:
 - EmbedWorker: Watermark embedding with progress tracking
 - ExtractWorker: Blind watermark extraction
 - PreviewWorker: Real-time preview generation with debounce
+- PreviewEngine: Long-lived latest-wins preview thread (debounces itself)
+- ImageLoadTask: Off-thread image decoding for UI pixmaps
+- WORKER_POOL: Shared thread pool for per-image batch work
 """
 
 from .embed_worker import EmbedWorker, EmbedConfig, VisibleConfig, BlindConfig, EmbedResult
 from .extract_worker import ExtractWorker, ExtractConfig, ExtractResult, BatchExtractWorker
 from .preview_worker import (
-    PreviewWorker, PreviewConfig, PreviewDebouncer, PreviewManager,
+    PreviewWorker, PreviewEngine, PreviewConfig, PreviewManager,
     pil_image_to_qpixmap
 )
+from .image_loader import ImageLoadTask, ImageLoadSignals
+from .pool import WORKER_POOL
 
 __all__ = [
     # Embed
@@ -32,8 +37,13 @@ __all__ = [
     "BatchExtractWorker",
     # Preview
     "PreviewWorker",
+    "PreviewEngine",
     "PreviewConfig",
-    "PreviewDebouncer",
     "PreviewManager",
     "pil_image_to_qpixmap",
+    # Image loading
+    "ImageLoadTask",
+    "ImageLoadSignals",
+    # Thread pool
+    "WORKER_POOL",
 ]
@@ -4,29 +4,43 @@ Embed Worker - Async Watermark Embedding
 QThread worker for embedding visible and/or blind watermarks.
 
 Workflow:
-1. For each image in the queue:
+1. For each image in the queue (processed concurrently on WORKER_POOL):
    a. Apply visible watermark (if enabled)
-   b. Apply blind watermark (if enabled)
+   b. Apply blind watermark (if enabled), taking the visible result
+      straight from memory when both are enabled; with blind enabled
+      an image holds one of the BLIND_SLOTS for its whole processing
    c. Save to output directory with proper naming
-2. Emit progress signals during processing
+2. Emit progress signals as each image completes
 3. Emit finished signal with results
 
 Naming Convention:
 - Visible only: filename_watermarked.png
 - Blind only: filename_blind-{bit_length}.png
 - Both: filename_watermarked_blind-{bit_length}.png
+
+Blind outputs are written to a partial file inside output_dir and then
+renamed with os.replace, so the final move is atomic and never copies data.
 """
 
+import os
 import tempfile
+import time
 import traceback
+from concurrent.futures import as_completed, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List, Tuple
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from app.core.blind import BlindWatermarkerAdapter
+from app.core.blind import BlindWatermarkerAdapter, BlindEmbedPlan
 from app.core.visible import VisibleWatermarker
+from app.workers.pool import BLIND_SLOTS, WORKER_POOL
+
+# zlib level for PNGs written by the visible step. Lossless either way;
+# level 1 encodes several times faster than Pillow's default 6 and matches
+# the level OpenCV uses for the blind watermark output.
+PNG_COMPRESS_LEVEL = 1
 
 
 @dataclass
@@ -61,6 +75,33 @@ class EmbedConfig:
     # Output format: "png" recommended for blind watermark preservation
     output_format: str = "png"
 
+    def validate(self) -> Optional[str]:
+        """
+        Check the configuration before starting a worker.
+        
+        Returns:
+            Error message if the configuration is invalid, None otherwise.
+        """
+        if not self.image_paths:
+            return "No images to process"
+
+        if self.visible.enabled and not self.visible.text.strip():
+            return "Visible watermark text cannot be empty"
+
+        if self.blind.enabled:
+            if not self.blind.password:
+                return "Blind watermark password cannot be empty"
+            if not self.blind.text.strip():
+                return "Blind watermark text cannot be empty"
+            text_bytes = len(self.blind.text.encode("utf-8"))
+            if text_bytes > BlindWatermarkerAdapter.MAX_TEXT_BYTES:
+                return (
+                    f"Blind watermark text too long: {text_bytes} bytes "
+                    f"(max: {BlindWatermarkerAdapter.MAX_TEXT_BYTES})"
+                )
+
+        return None
+
 
 @dataclass
 class EmbedResult:
@@ -75,20 +116,31 @@ class EmbedResult:
 class EmbedWorker(QThread):
     """
     Worker thread for embedding watermarks into images.
+
+    Images are processed concurrently on the shared WORKER_POOL; results
+    are emitted in completion order. With blind enabled, images are further
+    limited by the shared BLIND_SLOTS to bound peak memory. To avoid
+    flooding the GUI thread on large batches of small files, progress and
+    images_completed_batch are only emitted every BATCH_EMIT_SIZE images
+    or BATCH_EMIT_INTERVAL seconds (and once more for the last image).
     
     Signals:
         progress(int, int, str): (current, total, current_file_name)
-        image_completed(EmbedResult): Emitted when each image is processed
+        images_completed_batch(list[EmbedResult]): Results since last batch
         finished_all(list[EmbedResult]): Emitted when all images are done
         error(str): Emitted on critical errors
     """
 
     # Signals
     progress = pyqtSignal(int, int, str)  # current, total, filename
-    image_completed = pyqtSignal(object)  # EmbedResult
+    images_completed_batch = pyqtSignal(list)  # List[EmbedResult]
     finished_all = pyqtSignal(list)  # List[EmbedResult]
     error = pyqtSignal(str)  # Error message
 
+    # Batched emission thresholds
+    BATCH_EMIT_SIZE = 5
+    BATCH_EMIT_INTERVAL = 0.1  # seconds
+
     def __init__(self, config: EmbedConfig, parent=None):
         """
         Initialize the embed worker.
@@ -104,6 +156,7 @@ class EmbedWorker(QThread):
         # Initialize processors
         self._visible_wm: Optional[VisibleWatermarker] = None
         self._blind_wm: Optional[BlindWatermarkerAdapter] = None
+        self._blind_plan: Optional[BlindEmbedPlan] = None
 
     def cancel(self):
         """Request cancellation of the worker."""
@@ -116,16 +169,22 @@ class EmbedWorker(QThread):
 
         if self.config.blind.enabled:
             self._blind_wm = BlindWatermarkerAdapter()
+            # Derive the seed and payload bits once for the whole batch
+            self._blind_plan = self._blind_wm.prepare(
+                password=self.config.blind.password,
+                text=self.config.blind.text
+            )
 
     def _cleanup_processors(self):
         """Clean up processor resources."""
         if self._visible_wm is not None:
-            self._visible_wm._cached_fonts.clear()
+            self._visible_wm.clear_font_cache()
             self._visible_wm = None
 
         if self._blind_wm is not None:
             self._blind_wm.cleanup()
             self._blind_wm = None
+            self._blind_plan = None
 
     def _generate_output_filename(
             self,
@@ -167,6 +226,24 @@ class EmbedWorker(QThread):
             return f"{base_name}_output{suffix}"
 
     def _process_single_image(self, image_path: Path) -> EmbedResult:
+        """
+        Process a single image, holding a blind slot when blind is enabled.
+        
+        The slot is taken before the image is decoded, so images queued
+        for a slot hold no pixels in memory.
+        
+        Args:
+            image_path: Path to the source image.
+            
+        Returns:
+            EmbedResult with processing outcome.
+        """
+        if self.config.blind.enabled:
+            with BLIND_SLOTS:
+                return self._embed_single_image(image_path)
+        return self._embed_single_image(image_path)
+
+    def _embed_single_image(self, image_path: Path) -> EmbedResult:
         """
         Process a single image with configured watermarks.
         
@@ -177,31 +254,29 @@ class EmbedWorker(QThread):
             EmbedResult with processing outcome.
         """
         result = EmbedResult(source_path=image_path)
-        temp_file: Optional[Path] = None
+        # Visible result handed to the blind step in memory (both enabled)
+        visible_image = None
         bit_length: Optional[int] = None
 
         try:
             # Ensure output directory exists
             self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Track current working image path
-            current_image = image_path
-
             # Step 1: Apply visible watermark (if enabled)
             if self.config.visible.enabled and self._visible_wm is not None:
                 vis_cfg = self.config.visible
 
-                # If blind watermark is also enabled, save to temp file first
+                # If blind watermark is also enabled, keep the result in
+                # memory for it instead of writing and re-reading a file
                 if self.config.blind.enabled:
-                    temp_file = Path(tempfile.mktemp(suffix=".png"))
-                    vis_output = temp_file
+                    vis_output = None
                 else:
                     # Generate output filename (visible only)
                     output_name = self._generate_output_filename(image_path, None)
                     vis_output = self.config.output_dir / output_name
 
                 visible_result = self._visible_wm.process(
-                    image_path=current_image,
+                    image_path=image_path,
                     text=vis_cfg.text,
                     size=vis_cfg.font_size,
                     opacity=vis_cfg.opacity,
@@ -209,29 +284,41 @@ class EmbedWorker(QThread):
                     color=vis_cfg.color,
                     output_path=vis_output,
                     spacing_h_ratio=vis_cfg.spacing_h_ratio,
-                    spacing_v_ratio=vis_cfg.spacing_v_ratio
+                    spacing_v_ratio=vis_cfg.spacing_v_ratio,
+                    compress_level=PNG_COMPRESS_LEVEL
                 )
-                visible_result.close()
-                current_image = vis_output
-
-                # If no blind watermark, set the final output path
-                if not self.config.blind.enabled:
+                if self.config.blind.enabled:
+                    visible_image = visible_result
+                else:
+                    visible_result.close()
                     result.output_path = vis_output
 
             # Step 2: Apply blind watermark (if enabled)
-            if self.config.blind.enabled and self._blind_wm is not None:
-                blind_cfg = self.config.blind
-
-                # First, embed to get the bit_length
-                temp_blind_output = Path(tempfile.mktemp(suffix=".png"))
+            if self.config.blind.enabled and self._blind_plan is not None:
+                # First, embed to get the bit_length. The partial file is
+                # reserved inside output_dir so the final rename stays on
+                # the same filesystem (metadata-only, no copy)
+                fd, partial_name = tempfile.mkstemp(
+                    prefix=f"{image_path.stem}.",
+                    suffix=".__embedding__.png",
+                    dir=self.config.output_dir
+                )
+                os.close(fd)
+                temp_blind_output = Path(partial_name)
 
                 try:
-                    _, bit_length = self._blind_wm.embed(
-                        image_path=current_image,
-                        password=blind_cfg.password,
-                        text=blind_cfg.text,
-                        output_path=temp_blind_output
-                    )
+                    if visible_image is not None:
+                        _, bit_length = self._blind_wm.embed_image_with(
+                            self._blind_plan,
+                            visible_image,
+                            output_path=temp_blind_output
+                        )
+                    else:
+                        _, bit_length = self._blind_wm.embed_with(
+                            self._blind_plan,
+                            image_path=image_path,
+                            output_path=temp_blind_output
+                        )
 
                     result.bit_length = bit_length
 
@@ -241,9 +328,9 @@ class EmbedWorker(QThread):
                     )
                     final_output = self.config.output_dir / final_output_name
 
-                    # Move/rename the temp file to final location
-                    import shutil
-                    shutil.move(str(temp_blind_output), str(final_output))
+                    # Rename the partial file to its final name (same
+                    # directory, so os.replace never falls back to a copy)
+                    os.replace(temp_blind_output, final_output)
 
                     result.output_path = final_output
 
@@ -263,12 +350,8 @@ class EmbedWorker(QThread):
             traceback.print_exc()
 
         finally:
-            # Clean up temp file from visible watermark step
-            if temp_file is not None and temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except OSError:
-                    pass
+            if visible_image is not None:
+                visible_image.close()
 
         return result
 
@@ -277,49 +360,71 @@ class EmbedWorker(QThread):
         Main worker execution.
         
         Processes all images in the config and emits progress signals.
+        Callers should check config.validate() before start(); it is
+        re-checked here only as a guard.
         """
         results: List[EmbedResult] = []
         total = len(self.config.image_paths)
 
-        if total == 0:
-            self.error.emit("No images to process")
+        error = self.config.validate()
+        if error:
+            self.error.emit(error)
             self.finished_all.emit(results)
             return
 
         try:
-            # Validate config
-            if self.config.visible.enabled and not self.config.visible.text.strip():
-                self.error.emit("Visible watermark text cannot be empty")
-                self.finished_all.emit(results)
-                return
-
-            if self.config.blind.enabled:
-                if not self.config.blind.password:
-                    self.error.emit("Blind watermark password cannot be empty")
-                    self.finished_all.emit(results)
-                    return
-                if not self.config.blind.text.strip():
-                    self.error.emit("Blind watermark text cannot be empty")
-                    self.finished_all.emit(results)
-                    return
-
-            # Setup processors
             self._setup_processors()
+        except ValueError as e:
+            # prepare() rejected the blind text/password: a user input
+            # error, reported as-is rather than as a critical failure
+            self._cleanup_processors()
+            self.error.emit(str(e))
+            self.finished_all.emit(results)
+            return
 
-            # Process each image
-            for idx, image_path in enumerate(self.config.image_paths):
-                if self._is_cancelled:
-                    break
-
-                # Emit progress
-                self.progress.emit(idx + 1, total, image_path.name)
-
-                # Process image
-                result = self._process_single_image(image_path)
-                results.append(result)
-
-                # Emit individual result
-                self.image_completed.emit(result)
+        try:
+            # Process images concurrently on the shared pool
+            futures = {
+                WORKER_POOL.submit(self._process_single_image, image_path): idx
+                for idx, image_path in enumerate(self.config.image_paths)
+            }
+            completed: dict[int, EmbedResult] = {}
+            pending: List[EmbedResult] = []
+            last_emit = time.monotonic()
+
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    if self._is_cancelled:
+                        break
+
+                    result = future.result()
+                    completed[futures[future]] = result
+                    pending.append(result)
+
+                    # Emit progress and the pending batch
+                    now = time.monotonic()
+                    if (len(pending) >= self.BATCH_EMIT_SIZE
+                            or now - last_emit >= self.BATCH_EMIT_INTERVAL
+                            or done == total):
+                        self.progress.emit(done, total, result.source_path.name)
+                        self.images_completed_batch.emit(pending)
+                        pending = []
+                        last_emit = now
+            finally:
+                # Drop queued images and let running ones finish before the
+                # processors they share are cleaned up
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+
+            # Images already running when a cancel came in still finished,
+            # and wrote their outputs; report them too
+            for future, idx in futures.items():
+                if idx not in completed and not future.cancelled():
+                    completed[idx] = future.result()
+
+            # Keep the input order for the final results
+            results = [completed[idx] for idx in sorted(completed)]
 
         except Exception as e:
             self.error.emit(f"Critical error: {str(e)}")
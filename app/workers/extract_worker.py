@@ -10,13 +10,15 @@ Workflow:
 """
 
 import traceback
+from concurrent.futures import as_completed, wait
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from app.core.blind import BlindWatermarkerAdapter
+from app.core.blind import BlindWatermarkerAdapter, BlindExtractPlan
+from app.workers.pool import BLIND_SLOTS, WORKER_POOL
 
 
 @dataclass
@@ -26,6 +28,24 @@ class ExtractConfig:
     password: str
     bit_length: int  # Required - from embed result
 
+    def validate(self) -> Optional[str]:
+        """
+        Check the configuration before starting a worker.
+        
+        Returns:
+            Error message if the configuration is invalid, None otherwise.
+        """
+        if not self.image_path.exists():
+            return f"Image not found: {self.image_path}"
+
+        if not self.password:
+            return "Password cannot be empty"
+
+        if self.bit_length <= 0:
+            return "Invalid bit_length value"
+
+        return None
+
 
 @dataclass
 class ExtractResult:
@@ -72,17 +92,10 @@ class ExtractWorker(QThread):
         result = ExtractResult(source_path=self.config.image_path)
 
         try:
-            # Validate config
-            if not self.config.image_path.exists():
-                raise FileNotFoundError(
-                    f"Image not found: {self.config.image_path}"
-                )
-
-            if not self.config.password:
-                raise ValueError("Password cannot be empty")
-
-            if self.config.bit_length <= 0:
-                raise ValueError("Invalid bit_length value")
+            # Guard only; callers check config.validate() before start()
+            error = self.config.validate()
+            if error:
+                raise ValueError(error)
 
             # Emit started signal
             self.started_extraction.emit(self.config.image_path.name)
@@ -131,6 +144,7 @@ class BatchExtractWorker(QThread):
     Worker thread for extracting blind watermarks from multiple images.
     
     Useful when processing a batch of images with the same password/bit_length.
+    Images are extracted concurrently on the shared WORKER_POOL.
     
     Signals:
         progress(int, int, str): (current, total, filename)
@@ -167,11 +181,36 @@ class BatchExtractWorker(QThread):
         self.bit_length = bit_length
         self._is_cancelled = False
         self._blind_wm: Optional[BlindWatermarkerAdapter] = None
+        self._blind_plan: Optional[BlindExtractPlan] = None
 
     def cancel(self):
         """Request cancellation of the worker."""
         self._is_cancelled = True
 
+    def _extract_single_image(self, image_path: Path) -> ExtractResult:
+        """Extract the watermark from one image (runs on WORKER_POOL)."""
+        result = ExtractResult(source_path=image_path)
+
+        try:
+            if not image_path.exists():
+                raise FileNotFoundError(f"Image not found: {image_path}")
+
+            # Same DWT as an embed, so it shares the embed's memory cap
+            with BLIND_SLOTS:
+                extracted_text = self._blind_wm.extract_with(
+                    self._blind_plan,
+                    image_path=image_path
+                )
+
+            result.extracted_text = extracted_text
+            result.success = True
+
+        except Exception as e:
+            result.success = False
+            result.error_message = str(e)
+
+        return result
+
     def run(self):
         """
         Main worker execution.
@@ -198,38 +237,45 @@ class BatchExtractWorker(QThread):
                 self.finished_all.emit(results)
                 return
 
-            # Initialize extractor
+            # Initialize extractor and derive the seed once for the batch
             self._blind_wm = BlindWatermarkerAdapter()
+            self._blind_plan = self._blind_wm.prepare_extract(
+                password=self.password,
+                bit_length=self.bit_length
+            )
 
-            for idx, image_path in enumerate(self.image_paths):
-                if self._is_cancelled:
-                    break
-
-                # Emit progress
-                self.progress.emit(idx + 1, total, image_path.name)
-
-                # Process
-                result = ExtractResult(source_path=image_path)
-
-                try:
-                    if not image_path.exists():
-                        raise FileNotFoundError(f"Image not found: {image_path}")
-
-                    extracted_text = self._blind_wm.extract(
-                        image_path=image_path,
-                        password=self.password,
-                        bit_length=self.bit_length
-                    )
-
-                    result.extracted_text = extracted_text
-                    result.success = True
-
-                except Exception as e:
-                    result.success = False
-                    result.error_message = str(e)
-
-                results.append(result)
-                self.image_completed.emit(result)
+            # Process images concurrently on the shared pool
+            futures = {
+                WORKER_POOL.submit(self._extract_single_image, image_path): idx
+                for idx, image_path in enumerate(self.image_paths)
+            }
+            completed: dict[int, ExtractResult] = {}
+
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    if self._is_cancelled:
+                        break
+
+                    result = future.result()
+                    completed[futures[future]] = result
+
+                    # Emit progress and individual result
+                    self.progress.emit(done, total, result.source_path.name)
+                    self.image_completed.emit(result)
+            finally:
+                # Let running extractions finish before cleanup
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+
+            # Images already running when a cancel came in still finished,
+            # and wrote their outputs; report them too
+            for future, idx in futures.items():
+                if idx not in completed and not future.cancelled():
+                    completed[idx] = future.result()
+
+            # Keep the input order for the final results
+            results = [completed[idx] for idx in sorted(completed)]
 
         except Exception as e:
             self.error.emit(f"Critical error: {str(e)}")
@@ -239,5 +285,6 @@ class BatchExtractWorker(QThread):
             if self._blind_wm is not None:
                 self._blind_wm.cleanup()
                 self._blind_wm = None
+            self._blind_plan = None
 
         self.finished_all.emit(results)
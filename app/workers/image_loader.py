@@ -0,0 +1,88 @@
+"""
+Image Loader - Off-Thread Image Decoding
+========================================
+QRunnable task for decoding images on the global QThreadPool.
+
+QPixmap may only be created on the GUI thread, so the task decodes into a
+QImage with QImageReader and hands it back through a queued signal. The
+receiver converts it with QPixmap.fromImage on the GUI thread.
+
+Usage:
+    task = ImageLoadTask(path, QSize(90, 90))
+    task.signals.loaded.connect(on_loaded)  # on_loaded(key, image)
+    QThreadPool.globalInstance().start(task)
+"""
+
+from pathlib import Path
+from typing import Optional, Any
+
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+
+class ImageLoadSignals(QObject):
+    """
+    Signal carrier for ImageLoadTask (QRunnable is not a QObject).
+
+    Signals:
+        loaded(object, QImage): (key, image). The image is null on failure.
+    """
+
+    loaded = pyqtSignal(object, QImage)
+
+
+class ImageLoadTask(QRunnable):
+    """
+    Decode an image file on a pool thread, optionally scaling it.
+
+    When a size is given the reader decodes straight to the scaled size
+    (JPEG uses DCT scaling), so a large photo is never fully decompressed
+    just to build a thumbnail. The receiver only needs a cheap
+    QPixmap.fromImage conversion.
+    """
+
+    def __init__(
+            self,
+            path: Path,
+            size: Optional[QSize] = None,
+            aspect_mode: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio,
+            key: Any = None
+    ):
+        """
+        Initialize the load task.
+
+        Args:
+            path: Image file to decode.
+            size: Optional target size for a smooth downscale.
+            aspect_mode: Aspect ratio mode used when scaling to size.
+            key: Opaque value echoed back in the loaded signal
+                 (defaults to path).
+        """
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.aspect_mode = aspect_mode
+        self.key = path if key is None else key
+        self.signals = ImageLoadSignals()
+
+    def run(self):
+        """Decode (and scale) the image, then emit it."""
+        reader = QImageReader(str(self.path))
+        reader.setAutoTransform(True)
+
+        scaled_size = reader.size() if self.size is not None else QSize()
+        if scaled_size.isValid():
+            scaled_size.scale(self.size, self.aspect_mode)
+            reader.setScaledSize(scaled_size)
+
+        image = reader.read()
+
+        # Fallback for formats that cannot report their size up front
+        if not image.isNull() and self.size is not None and not scaled_size.isValid():
+            image = image.scaled(
+                self.size,
+                self.aspect_mode,
+                Qt.TransformationMode.SmoothTransformation
+            )
+
+        self.signals.loaded.emit(self.key, image)
@@ -0,0 +1,37 @@
+"""
+Worker Pool - Shared Thread Pool for Batch Jobs
+===============================================
+One ThreadPoolExecutor shared by the batch workers.
+
+Pillow decode/encode, OpenCV and NumPy release the GIL for the heavy
+parts, so processing several images at once overlaps their IO, decode
+and encode instead of running them back to back.
+
+Blind watermark jobs (embed and extract) additionally hold one of the
+BLIND_SLOTS while they have an image in memory.
+
+Usage:
+    futures = [WORKER_POOL.submit(process, path) for path in paths]
+    for future in as_completed(futures):
+        ...
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Capped so a batch of large images doesn't hold too many full-resolution
+# buffers in memory at once
+MAX_POOL_WORKERS = min(8, os.cpu_count() or 1)
+
+WORKER_POOL = ThreadPoolExecutor(
+    max_workers=MAX_POOL_WORKERS,
+    thread_name_prefix="nightcat-worker"
+)
+
+# A blind embed or extract runs a full-resolution float DWT and holds
+# several times the image size in memory, far more than the other steps,
+# so only this many run at once across every worker even though
+# WORKER_POOL has more threads
+MAX_CONCURRENT_BLIND_JOBS = 2
+BLIND_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_BLIND_JOBS)
@@ -36,16 +36,23 @@ The final output (EmbedWorker) still uses ORIGINAL resolution and ORIGINAL
 parameters. This module ONLY optimizes the interactive preview loop.
 """
 
+import atexit
+import mmap
+import threading
 import traceback
-from dataclasses import dataclass
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional, Tuple, Dict
+from typing import Callable, Iterable, Optional, Tuple, Union
 
-from PIL import Image, ImageFont
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer, QObject, QMutex, QMutexLocker
+import numpy as np
+from PIL import ExifTags, Image, ImageOps
+from PyQt6.QtCore import QCoreApplication, QThread, pyqtSignal, QObject
 from PyQt6.QtGui import QImage, QPixmap
 
 from app.core.visible import VisibleWatermarker
+from app.workers.pool import WORKER_POOL
 
 
 # =============================================================================
@@ -70,65 +77,163 @@ class PreviewConfig:
     spacing_h_ratio: float = 2.5  # These ratios are unitless, no scaling needed
     spacing_v_ratio: float = 2.0
     max_preview_size: int = 800  # Maximum proxy dimension
+    progressive: bool = False  # PreviewEngine: coarse frame first, then refine
+
+    def validate(self) -> Optional[str]:
+        """
+        Check the configuration before it is handed to a render thread.
+        
+        Returns:
+            User-facing error message if nothing can be rendered, None otherwise.
+        """
+        if not self.image_path or not self.image_path.exists():
+            return "尚未選擇圖片"
+
+        if self.visible_enabled and not self.visible_text.strip():
+            return "水印文字為空"
+
+        return None
 
 
 # =============================================================================
 # GLOBAL CACHES (Shared across all workers for maximum efficiency)
 # =============================================================================
 
-# Proxy image cache: maps "path:max_size" -> (proxy_image, original_size)
-# This avoids reloading and resizing the same image repeatedly
-_proxy_cache: Dict[str, Tuple[Image.Image, Tuple[int, int]]] = {}
-_proxy_cache_lock = QMutex()
-
-# Global font cache: shared across all watermarker instances
-# Fonts are expensive to load, especially for CJK character sets
-_global_font_cache: Dict[Tuple[Optional[str], int], ImageFont.FreeTypeFont] = {}
-_font_cache_lock = QMutex()
+# Proxy image cache: maps "path:max_size" -> (proxy_array, original_size, is_proxy)
+# ("path:full" for images small enough to need no resize)
+# Proxies are stored as contiguous HxWx4 uint8 RGBA arrays; PIL views are
+# made with Image.fromarray only where a PIL API is needed.
+# This avoids reloading and resizing the same image repeatedly.
+# EXIF orientation is resolved once on a miss and baked into the cached
+# pixels (and original_size), so cache hits never touch EXIF again.
+# READ-ONLY: cached proxies are handed out without copying, so callers must
+# never mutate them in place (the arrays are flagged non-writeable and the
+# watermark path composites into a new image)
+# LRU order: hits move to the end, eviction pops from the front until the
+# cached pixels fit in MAX_PROXY_CACHE_BYTES
+_proxy_cache: "OrderedDict[str, Tuple[np.ndarray, Tuple[int, int], bool]]" = OrderedDict()
+_proxy_cache_lock = threading.Lock()
+# Total pixel bytes held by _proxy_cache (guarded by _proxy_cache_lock)
+_proxy_cache_bytes = 0
+
+# Watermarker shared by every preview render, so its font objects stay
+# loaded across slider ticks (fonts are expensive to load, especially for
+# CJK character sets). Its caches are safe to share between the preview
+# thread and prewarm tasks: fonts, text masks and tile stamps each sit
+# behind their own lock.
+_preview_watermarker = VisibleWatermarker()
+
+# Cache bound (prevents memory bloat): proxies by pixel bytes
+MAX_PROXY_CACHE_BYTES = 64 * 1024 * 1024  # ~25 proxies at 800x800 RGBA
+
+# Proxy resize: reduce by an integer factor until within 2x of the target
+PROXY_REDUCING_GAP = 2.0
+
+# Progressive previews render a coarse frame at max_preview_size // this
+PROGRESSIVE_COARSE_DIVISOR = 2
+
+
+def _mmap_open(image_path: Path) -> Tuple[Image.Image, Optional[mmap.mmap]]:
+    """
+    Open an image over a read-only memory map of the file.
+    
+    The decoder then reads straight from the page cache instead of through
+    small buffered reads. The returned map must stay open until the image
+    has been loaded. Falls back to a regular open (and None) for files that
+    cannot be mapped, e.g. empty files.
+    """
+    try:
+        with open(image_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return Image.open(image_path), None
 
-# Maximum cache entries (prevents memory bloat)
-MAX_PROXY_CACHE_SIZE = 10
-MAX_FONT_CACHE_SIZE = 50
+    try:
+        return Image.open(mm), mm
+    except Exception:
+        # Let the regular open raise its usual error for unreadable files
+        mm.close()
+        return Image.open(image_path), None
 
 
-def _get_cached_proxy(image_path: Path, max_size: int) -> Tuple[Image.Image, Tuple[int, int]]:
+def _get_cached_proxy(image_path: Path, max_size: int) -> Tuple[np.ndarray, Tuple[int, int], bool]:
     """
     Get or create a cached proxy image with AGGRESSIVE downsampling.
     
     PERFORMANCE NOTES:
     - Uses BILINEAR resampling (faster than LANCZOS, good enough for preview)
+    - Uses reducing_gap so most of the shrink is a cheap integer box reduce
+    - Uses Image.draft so JPEGs are decoded at a reduced DCT scale
+    - Decodes from a memory-mapped file (see _mmap_open)
     - Handles EXIF orientation to avoid surprise rotations
-    - Returns a COPY to prevent accidental mutation of cached data
+    - Returns the cached RGBA array itself (no copy); it is read-only
+    - Images already within max_size are used as-is (no resize, no copy)
+      and cached once for every max_size they fit in
     
     Args:
         image_path: Path to the original image
         max_size: Maximum dimension (width or height) for the proxy
         
     Returns:
-        Tuple of (proxy_image_copy, original_size)
+        Tuple of (proxy_array, original_size, is_proxy). The proxy is a
+        contiguous HxWx4 uint8 RGBA array shared with the cache (not
+        writeable). is_proxy
+        is False when the image was small enough to use at full size, so
+        callers can skip parameter scaling.
         
     Complexity: O(1) for cache hit, O(N) for cache miss where N = original pixels
     """
     cache_key = f"{image_path}:{max_size}"
+    # Images that fit without resizing are cached once under this key and
+    # shared by every max_size they fit in (e.g. coarse and full passes)
+    full_key = f"{image_path}:full"
 
     # Fast path: check cache first (with minimal lock time)
-    with QMutexLocker(_proxy_cache_lock):
+    with _proxy_cache_lock:
         if cache_key in _proxy_cache:
-            proxy, orig_size = _proxy_cache[cache_key]
-            # Return a copy to prevent mutation of cached image
-            return proxy.copy(), orig_size
+            _proxy_cache.move_to_end(cache_key)
+            return _proxy_cache[cache_key]
+        entry = _proxy_cache.get(full_key)
+        if entry is not None and max(entry[1]) <= max_size:
+            _proxy_cache.move_to_end(full_key)
+            return entry
 
     # Slow path: load and downsample the original image
-    original = Image.open(image_path)
+    original, mm = _mmap_open(image_path)
+    full_width, full_height = original.size
+
+    # JPEG shrink-on-load: libjpeg decodes at the smallest 1/2, 1/4 or 1/8
+    # scale that still covers the proxy size (no-op for other formats); the
+    # DCT scaling already averages, so no extra oversampling is needed.
+    # draft only reduces if BOTH sides stay above the request, so ask for
+    # the aspect-correct size rather than a square box.
+    long_side = max(full_width, full_height)
+    if long_side > max_size:
+        draft_scale = max_size / long_side
+        original.draft("RGB", (int(full_width * draft_scale), int(full_height * draft_scale)))
+    drafted_size = original.size
+
+    # Decode now so the file mapping can be released
+    try:
+        original.load()
+    finally:
+        if mm is not None:
+            mm.close()
 
-    # Handle EXIF orientation (critical for phone photos!)
+    # Handle EXIF orientation (critical for phone photos!). Only done on a
+    # cache miss; the cached proxy is already upright.
     original = _apply_exif_orientation(original)
 
-    orig_size = original.size
+    # Original size in display orientation (a 90/270 rotation swaps it)
+    if original.size != drafted_size:
+        orig_size = (full_height, full_width)
+    else:
+        orig_size = (full_width, full_height)
     orig_width, orig_height = orig_size
 
     # Calculate proxy dimensions maintaining aspect ratio
-    if orig_width > max_size or orig_height > max_size:
+    is_proxy = orig_width > max_size or orig_height > max_size
+    if is_proxy:
         if orig_width > orig_height:
             new_width = max_size
             new_height = int(orig_height * (max_size / orig_width))
@@ -137,26 +242,46 @@ def _get_cached_proxy(image_path: Path, max_size: int) -> Tuple[Image.Image, Tup
             new_width = int(orig_width * (max_size / orig_height))
 
         # PERFORMANCE: Use BILINEAR (faster) instead of LANCZOS (slower)
-        # For preview, visual quality difference is negligible
-        proxy = original.resize((new_width, new_height), Image.Resampling.BILINEAR)
+        # For preview, visual quality difference is negligible.
+        # reducing_gap first shrinks by an integer factor with Image.reduce
+        # (box filter, C loop), so BILINEAR only runs on a ~2x-target image
+        proxy = original.resize(
+            (new_width, new_height),
+            Image.Resampling.BILINEAR,
+            reducing_gap=PROXY_REDUCING_GAP
+        )
     else:
-        # Image is smaller than max_size, use as-is
-        proxy = original.copy()
+        # Image is smaller than max_size, use the decoded original as-is
+        # (nothing else holds a reference, so no defensive copy)
+        proxy = original
 
     # Ensure RGBA mode for proper alpha compositing
     if proxy.mode != "RGBA":
         proxy = proxy.convert("RGBA")
 
-    # Cache the proxy (with LRU-style eviction)
-    with QMutexLocker(_proxy_cache_lock):
-        # Evict oldest entry if cache is full
-        if len(_proxy_cache) >= MAX_PROXY_CACHE_SIZE:
-            oldest_key = next(iter(_proxy_cache))
-            del _proxy_cache[oldest_key]
+    # Store as a contiguous RGBA array (one copy, on the miss path only)
+    proxy = np.ascontiguousarray(np.asarray(proxy))
+    proxy.flags.writeable = False
+
+    # Cache the proxy (with LRU eviction)
+    if not is_proxy:
+        cache_key = full_key
+    global _proxy_cache_bytes
+    with _proxy_cache_lock:
+        replaced = _proxy_cache.pop(cache_key, None)
+        if replaced is not None:
+            _proxy_cache_bytes -= replaced[0].nbytes
+
+        # Evict least recently used entries until the new one fits (a
+        # single oversized proxy is still cached on its own)
+        while _proxy_cache and _proxy_cache_bytes + proxy.nbytes > MAX_PROXY_CACHE_BYTES:
+            _, evicted = _proxy_cache.popitem(last=False)
+            _proxy_cache_bytes -= evicted[0].nbytes
 
-        _proxy_cache[cache_key] = (proxy.copy(), orig_size)
+        _proxy_cache[cache_key] = (proxy, orig_size, is_proxy)
+        _proxy_cache_bytes += proxy.nbytes
 
-    return proxy, orig_size
+    return proxy, orig_size, is_proxy
 
 
 def _apply_exif_orientation(image: Image.Image) -> Image.Image:
@@ -165,80 +290,262 @@ def _apply_exif_orientation(image: Image.Image) -> Image.Image:
     
     Phone cameras often save images with EXIF rotation metadata
     instead of actually rotating the pixels. This fixes that.
+    
+    ImageOps.exif_transpose uses lossless transposes (no resampling) and
+    also covers the mirrored orientations (2, 4, 5, 7).
     """
-    try:
-        from PIL import ExifTags
-
-        # Find the orientation tag
-        orientation_tag = None
-        for tag, name in ExifTags.TAGS.items():
-            if name == 'Orientation':
-                orientation_tag = tag
-                break
-
-        if orientation_tag is None:
-            return image
-
-        exif = image._getexif()
-        if exif is None:
-            return image
-
-        orientation = exif.get(orientation_tag)
-
-        # Apply rotation based on EXIF orientation value
-        rotations = {
-            3: 180,
-            6: 270,
-            8: 90
-        }
-
-        if orientation in rotations:
-            return image.rotate(rotations[orientation], expand=True)
+    # exif_transpose copies even when there is nothing to do, so skip it
+    # for the common upright case
+    if image.getexif().get(ExifTags.Base.Orientation, 1) == 1:
+        return image
 
-    except (AttributeError, KeyError, IndexError, TypeError):
-        pass
-
-    return image
+    return ImageOps.exif_transpose(image)
 
 
 def clear_proxy_cache():
     """Clear the proxy image cache (call when images are removed/changed)."""
-    with QMutexLocker(_proxy_cache_lock):
+    global _proxy_cache_bytes
+    with _proxy_cache_lock:
         _proxy_cache.clear()
+        _proxy_cache_bytes = 0
+
+
+def evict_proxy_cache(image_paths: Iterable[Path]):
+    """Drop the cached proxies of image_paths (e.g. images removed from the list)."""
+    global _proxy_cache_bytes
+    prefixes = {str(path) for path in image_paths}
+    with _proxy_cache_lock:
+        # Keys are "path:max_size" / "path:full"; rsplit keeps Windows
+        # drive colons in the path part
+        for key in [k for k in _proxy_cache if k.rsplit(":", 1)[0] in prefixes]:
+            _proxy_cache_bytes -= _proxy_cache.pop(key)[0].nbytes
 
 
 def clear_font_cache():
-    """Clear the global font cache."""
-    with QMutexLocker(_font_cache_lock):
-        _global_font_cache.clear()
+    """Clear the preview watermarker's loaded fonts."""
+    _preview_watermarker.clear_font_cache()
 
 
-def pil_image_to_qpixmap(pil_image: Image.Image) -> QPixmap:
+def pil_image_to_qpixmap(
+        image: Union[Image.Image, np.ndarray],
+        scratch: Optional[bytearray] = None
+) -> QPixmap:
     """
-    Convert PIL Image to QPixmap efficiently.
+    Convert a PIL Image (or HxWx4 uint8 RGBA array) to QPixmap efficiently.
     
-    IMPORTANT: Creates a copy of the QImage to ensure data ownership,
-    preventing crashes from garbage-collected PIL data.
+    The QImage is a view over the pixel array (no second QImage.copy());
+    arrays such as cached proxies are used directly without any copy. The
+    array is kept alive on the returned pixmap in case Qt shares the
+    buffer instead of converting it.
+    
+    For PIL input, np.asarray is a single full-size tobytes() (no chunk
+    join on current Pillow), and RGBA images skip the mode conversion.
+    
+    SCRATCH: a PIL image that fits in `scratch` (4 * width * height bytes)
+    is copied into it instead, so no pixel buffer is allocated per call.
+    QPixmap.fromImage converts the non-native RGBA8888 data into its own
+    storage, so the caller may overwrite the scratch buffer right after.
     """
-    if pil_image.mode != "RGBA":
-        pil_image = pil_image.convert("RGBA")
+    if isinstance(image, np.ndarray):
+        arr = image
+    else:
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+
+        width, height = image.size
+        if scratch is not None and len(scratch) >= 4 * width * height:
+            # Pillow core paste writes straight into the shared buffer
+            # (Image.paste would copy a read-only frombuffer image first)
+            view = Image.frombuffer(
+                "RGBA", image.size, scratch, "raw", "RGBA", 0, 1
+            )
+            view.im.paste(image.im, (0, 0, width, height))
+            qimage = QImage(
+                scratch, width, height, 4 * width, QImage.Format.Format_RGBA8888
+            )
+            return QPixmap.fromImage(qimage)
+
+        arr = np.asarray(image)
+    assert arr.flags["C_CONTIGUOUS"] and arr.strides[0] == arr.shape[1] * 4
 
-    data = pil_image.tobytes("raw", "RGBA")
     qimage = QImage(
-        data,
-        pil_image.width,
-        pil_image.height,
-        pil_image.width * 4,  # bytes per line
+        arr.data,
+        arr.shape[1],
+        arr.shape[0],
+        arr.strides[0],  # bytes per line
         QImage.Format.Format_RGBA8888
     )
 
-    # CRITICAL: .copy() ensures the QImage owns its data
-    # Without this, PIL garbage collection can corrupt the image
-    return QPixmap.fromImage(qimage.copy())
+    pixmap = QPixmap.fromImage(qimage)
+    pixmap._keepalive = arr
+    return pixmap
+
+
+# =============================================================================
+# PREVIEW RENDERING (The Core Engine)
+# =============================================================================
+
+def _preview_font_size(
+        config: PreviewConfig,
+        proxy_array: np.ndarray,
+        original_size: Tuple[int, int],
+        is_proxy: bool
+) -> int:
+    """Font size that keeps the watermark proportional on the proxy."""
+    if not is_proxy:
+        # Full-size image: the preview matches the final output exactly
+        return config.font_size
+
+    # This is the mathematical heart of the Proxy Pattern
+    proxy_height, proxy_width = proxy_array.shape[:2]
+    orig_width, orig_height = original_size
+
+    # Use the dominant dimension for scaling
+    # This ensures the preview accurately represents the final output
+    # Never above 1.0: the proxy is only ever a downscale
+    scale_factor = min(
+        1.0,
+        proxy_width / orig_width,
+        proxy_height / orig_height
+    )
+
+    # Font size must be scaled to maintain visual proportion
+    # Minimum 8px to ensure readability even for small previews
+    return max(8, int(config.font_size * scale_factor))
+
+
+def prewarm_preview(config: PreviewConfig) -> None:
+    """
+    Build the proxies and load the font a render of config will need.
+    
+    Runs the expensive first-render steps (decode, proxy resize, font
+    load) ahead of time so the real render starts from warm caches.
+    Errors are ignored here; the real render reports them.
+    """
+    sizes = [config.max_preview_size]
+    coarse_size = config.max_preview_size // PROGRESSIVE_COARSE_DIVISOR
+    if config.progressive and coarse_size > 0:
+        sizes.append(coarse_size)
+
+    try:
+        for size in sizes:
+            proxy_array, original_size, is_proxy = _get_cached_proxy(config.image_path, size)
+            if config.visible_enabled:
+                _preview_watermarker._get_font(
+                    _preview_font_size(config, proxy_array, original_size, is_proxy)
+                )
+    except Exception:
+        pass
+
+
+def render_preview(
+        config: PreviewConfig,
+        is_cancelled: Callable[[], bool],
+        on_ready: Callable[[QPixmap], None],
+        on_error: Callable[[str], None],
+        scratch: Optional[bytearray] = None
+) -> None:
+    """
+    Render one preview using the Proxy Pattern.
+    
+    Shared by PreviewWorker and PreviewEngine. Nothing is reported once
+    is_cancelled() returns True.
+    
+    ALGORITHM:
+    1. Load/get cached proxy image (small version)
+    2. Calculate scale_factor = proxy_size / original_size
+    3. Scale font_size by scale_factor
+    4. Apply watermark to PROXY (fast!)
+    5. Convert to QPixmap and report it
+    
+    TIME COMPLEXITY: O(proxy_pixels) << O(original_pixels)
+    
+    Args:
+        config: Preview settings (user's original parameters).
+        is_cancelled: Polled at check points to abort early.
+        on_ready: Called with the finished QPixmap.
+        on_error: Called with a user-facing error message.
+        scratch: Optional reusable conversion buffer for the result (see
+                 pil_image_to_qpixmap). Only safe to share between renders
+                 on the same thread.
+    """
+    try:
+        # === CANCELLATION CHECK POINT 1 ===
+        if is_cancelled():
+            return
+
+        # Validate input (PreviewManager already rejects invalid configs;
+        # re-checked here only as a guard)
+        error = config.validate()
+        if error:
+            on_error(error)
+            return
+
+        # === STEP 1: Get Proxy Image from Cache ===
+        # This is the KEY to our optimization
+        proxy_array, original_size, is_proxy = _get_cached_proxy(
+            config.image_path,
+            config.max_preview_size
+        )
+
+        # === CANCELLATION CHECK POINT 2 ===
+        if is_cancelled():
+            return
+
+        # If watermark is disabled, just show the proxy
+        if not config.visible_enabled:
+            pixmap = pil_image_to_qpixmap(proxy_array)
+            on_ready(pixmap)
+            return
+
+        # === STEP 2 & 3: Scale Parameters for Proxy ===
+        preview_font_size = _preview_font_size(config, proxy_array, original_size, is_proxy)
+
+        # NOTE: Spacing RATIOS don't need scaling - they're relative to font size
+        # The VisibleWatermarker internally calculates:
+        #   actual_spacing = font_size * ratio
+        # So the spacing scales automatically with font_size!
+
+        # === CANCELLATION CHECK POINT 3 ===
+        if is_cancelled():
+            return
+
+        # === STEP 4: Apply Watermark to PROXY (The Fast Part!) ===
+        # Process the PROXY image (not the original!)
+        # This is where we get our 96% speedup
+        result = _preview_watermarker.process_image_object(
+            image=Image.fromarray(proxy_array),  # zero-copy view
+            text=config.visible_text,
+            size=preview_font_size,  # SCALED font size
+            opacity=config.opacity,
+            angle=config.angle,
+            color=config.color,
+            spacing_h_ratio=config.spacing_h_ratio,  # Ratios unchanged
+            spacing_v_ratio=config.spacing_v_ratio
+        )
+
+        # Release the full-size result as soon as it has been converted
+        # (or abandoned) rather than whenever it is garbage collected
+        try:
+            # === CANCELLATION CHECK POINT 4 ===
+            if is_cancelled():
+                return
+
+            # === STEP 5: Convert and Emit ===
+            pixmap = pil_image_to_qpixmap(result, scratch)
+        finally:
+            result.close()
+
+        on_ready(pixmap)
+
+    except Exception as e:
+        if not is_cancelled():
+            on_error(f"預覽生成失敗：{str(e)}")
+            traceback.print_exc()
 
 
 # =============================================================================
-# PREVIEW WORKER (The Core Engine)
+# PREVIEW THREADS
 # =============================================================================
 
 class PreviewWorker(QThread):
@@ -249,6 +556,9 @@ class PreviewWorker(QThread):
     with parameters scaled proportionally. This reduces computation
     by 90-96% compared to processing the full-resolution image.
     
+    One-shot: renders a single config and exits. PreviewManager uses the
+    long-lived PreviewEngine instead.
+    
     THREAD SAFETY:
     - Uses `_is_cancelled` flag for cooperative cancellation
     - Checks cancellation at multiple points to abort early
@@ -272,165 +582,197 @@ class PreviewWorker(QThread):
         self._is_cancelled = True
 
     def run(self):
-        """
-        Main worker execution - implements the Proxy Pattern.
-        
-        ALGORITHM:
-        1. Load/get cached proxy image (small version)
-        2. Calculate scale_factor = proxy_size / original_size
-        3. Scale font_size by scale_factor
-        4. Apply watermark to PROXY (fast!)
-        5. Convert to QPixmap and emit
-        
-        TIME COMPLEXITY: O(proxy_pixels) << O(original_pixels)
-        """
-        try:
-            # === CANCELLATION CHECK POINT 1 ===
-            if self._is_cancelled:
-                return
-
-            # Validate input
-            if not self.config.image_path or not self.config.image_path.exists():
-                self.preview_error.emit("尚未選擇圖片")
-                return
-
-            # === STEP 1: Get Proxy Image from Cache ===
-            # This is the KEY to our optimization
-            proxy_image, original_size = _get_cached_proxy(
-                self.config.image_path,
-                self.config.max_preview_size
-            )
-
-            # === CANCELLATION CHECK POINT 2 ===
-            if self._is_cancelled:
-                return
-
-            # If watermark is disabled, just show the proxy
-            if not self.config.visible_enabled:
-                pixmap = pil_image_to_qpixmap(proxy_image)
-                self.preview_ready.emit(pixmap)
-                return
-
-            # Validate watermark text
-            if not self.config.visible_text.strip():
-                self.preview_error.emit("水印文字為空")
-                return
-
-            # === STEP 2: Calculate Scale Factor ===
-            # This is the mathematical heart of the Proxy Pattern
-            proxy_width, proxy_height = proxy_image.size
-            orig_width, orig_height = original_size
-
-            # Use the dominant dimension for scaling
-            # This ensures the preview accurately represents the final output
-            scale_factor = min(
-                proxy_width / orig_width,
-                proxy_height / orig_height
-            )
-
-            # === STEP 3: Scale Parameters for Proxy ===
-            # Font size must be scaled to maintain visual proportion
-            # Minimum 8px to ensure readability even for small previews
-            preview_font_size = max(8, int(self.config.font_size * scale_factor))
-
-            # NOTE: Spacing RATIOS don't need scaling - they're relative to font size
-            # The VisibleWatermarker internally calculates:
-            #   actual_spacing = font_size * ratio
-            # So the spacing scales automatically with font_size!
+        """Main worker execution - renders the config once."""
+        render_preview(
+            self.config,
+            lambda: self._is_cancelled,
+            self.preview_ready.emit,
+            self.preview_error.emit
+        )
 
-            # === CANCELLATION CHECK POINT 3 ===
-            if self._is_cancelled:
-                return
-
-            # === STEP 4: Apply Watermark to PROXY (The Fast Part!) ===
-            # Create watermarker with global font cache integration
-            watermarker = VisibleWatermarker()
-
-            # Process the PROXY image (not the original!)
-            # This is where we get our 96% speedup
-            result = watermarker.process_image_object(
-                image=proxy_image,
-                text=self.config.visible_text,
-                size=preview_font_size,  # SCALED font size
-                opacity=self.config.opacity,
-                angle=self.config.angle,
-                color=self.config.color,
-                spacing_h_ratio=self.config.spacing_h_ratio,  # Ratios unchanged
-                spacing_v_ratio=self.config.spacing_v_ratio
-            )
-
-            # === CANCELLATION CHECK POINT 4 ===
-            if self._is_cancelled:
-                return
 
-            # === STEP 5: Convert and Emit ===
-            pixmap = pil_image_to_qpixmap(result)
-            self.preview_ready.emit(pixmap)
+# Engines still alive at interpreter exit are stopped so Qt never destroys
+# a running thread (e.g. scripts that never enter the event loop)
+_live_engines: "weakref.WeakSet[PreviewEngine]" = weakref.WeakSet()
 
-        except Exception as e:
-            if not self._is_cancelled:
-                self.preview_error.emit(f"預覽生成失敗：{str(e)}")
-                traceback.print_exc()
 
+@atexit.register
+def _stop_live_engines():
+    for engine in list(_live_engines):
+        try:
+            engine.stop()
+        except RuntimeError:
+            pass  # Underlying QThread already deleted
 
-# =============================================================================
-# DEBOUNCER (Prevents Event Storm)
-# =============================================================================
 
-class PreviewDebouncer(QObject):
+class PreviewEngine(QThread):
     """
-    Debounce helper for preview requests.
+    Long-lived preview thread with a single latest-wins task slot.
+    
+    request_preview() overwrites the pending config and wakes the thread;
+    no thread is created or torn down per request. A render whose config
+    is no longer the latest request stops at the next check point and its
+    result is dropped.
+    
+    PROGRESSIVE: when config.progressive is set, a coarse frame at
+    max_preview_size // PROGRESSIVE_COARSE_DIVISOR (a quarter of the
+    pixels) is emitted via preview_coarse_ready first, then refined to the
+    full proxy size if no newer request arrived in between.
     
-    PROBLEM: Slider drag generates dozens of valueChanged events per second.
-    Without debouncing, each event would spawn a new preview worker.
+    DEDUP: a request identical (==) to the render in progress does not
+    restart it; the running render simply becomes current again. This
+    keeps slider wiggles that return to the same value from wasting work.
     
-    SOLUTION: Wait for the user to "settle" before triggering preview.
-    Only the LAST request within the debounce window actually fires.
+    DEBOUNCE (trailing edge, done by the consumer):
+    Slider drags generate dozens of requests per second. After waking, the
+    thread waits until no newer request has landed for delay_ms and only
+    then renders the latest config, so a burst collapses into one render
+    without a GUI-thread timer.
     
     TUNING:
     - 30-50ms: Very responsive, may still cause some CPU load
-    - 80-100ms: Balanced (current default)
+    - 80-100ms: Balanced
     - 150-200ms: More CPU-friendly, slightly laggy feel
     
     For the Proxy Pattern, 30-50ms is safe because proxy processing is fast.
+    
+    SCRATCH: the engine keeps one RGBA conversion buffer sized for
+    max_preview_size x max_preview_size and reuses it for every render, so
+    the pages are faulted in once per session rather than per slider tick.
+    
+    SIGNALS:
+    - preview_started(): Emitted when a render begins (after debounce)
+    - preview_coarse_ready(QPixmap): Coarse frame of a progressive render
+    - preview_ready(QPixmap): Emitted when the current preview is complete
+    - preview_error(str): Emitted on error
     """
 
-    preview_requested = pyqtSignal(object)
+    preview_started = pyqtSignal()
+    preview_coarse_ready = pyqtSignal(object)
+    preview_ready = pyqtSignal(object)
+    preview_error = pyqtSignal(str)
 
     def __init__(self, delay_ms: int = 50, parent=None):
         super().__init__(parent)
+        self._cond = threading.Condition()
+        self._pending: Optional[PreviewConfig] = None
+        # Most recent request (None after cancel); renders of anything
+        # else are stale
+        self._latest: Optional[PreviewConfig] = None
+        self._inflight: Optional[PreviewConfig] = None
+        # Bumped on every request/cancel; used to restart the debounce wait
+        self._generation = 0
+        self._stop = False
         self._delay_ms = delay_ms
-        self._timer = QTimer(self)
-        self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._on_timeout)
-        self._pending_config: Optional[PreviewConfig] = None
-        self._mutex = QMutex()
+        # Conversion buffer, only touched by the engine thread
+        self._scratch = bytearray()
+        _live_engines.add(self)
+
+    def set_delay_ms(self, delay_ms: int):
+        """Set the debounce delay applied before each render."""
+        with self._cond:
+            self._delay_ms = max(0, delay_ms)
 
     def request_preview(self, config: PreviewConfig):
-        """
-        Request a preview generation (debounced).
-        
-        Multiple rapid calls will be collapsed into a single call
-        after the debounce delay.
-        """
-        with QMutexLocker(self._mutex):
-            self._pending_config = config
-            # Reset the timer on each new request
-            self._timer.stop()
-            self._timer.start(self._delay_ms)
+        """Replace the pending config (latest wins) and wake the thread."""
+        with self._cond:
+            self._latest = config
+            self._generation += 1
+            if config == self._inflight:
+                # Identical render already running: let it finish
+                self._pending = None
+            else:
+                self._pending = config
+            self._cond.notify()
+
+        if not self.isRunning():
+            self.start()
 
     def cancel(self):
-        """Cancel any pending preview request."""
-        with QMutexLocker(self._mutex):
-            self._timer.stop()
-            self._pending_config = None
+        """Drop the pending config and abandon the render in progress."""
+        with self._cond:
+            self._pending = None
+            self._latest = None
+            self._generation += 1
+
+    def stop(self):
+        """Stop the thread and wait for it to exit."""
+        with self._cond:
+            self._stop = True
+            self._pending = None
+            self._latest = None
+            self._generation += 1
+            self._cond.notify()
+        self.wait()
+
+    def _is_stale(self, config: PreviewConfig) -> bool:
+        """True once a different request (or cancel/stop) superseded config."""
+        return self._stop or config != self._latest
+
+    def _scratch_for(self, config: PreviewConfig) -> bytearray:
+        """Return the scratch buffer, reallocated if config needs a bigger one."""
+        size = 4 * config.max_preview_size * config.max_preview_size
+        if len(self._scratch) < size:
+            self._scratch = bytearray(size)
+        return self._scratch
+
+    def run(self):
+        """Serve pending configs until stopped."""
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stop:
+                    self._cond.wait()
+
+                # Debounce: restart the wait whenever a newer request lands
+                while not self._stop and self._delay_ms > 0:
+                    generation = self._generation
+                    self._cond.wait(self._delay_ms / 1000)
+                    if self._generation == generation:
+                        break
+
+                if self._stop:
+                    return
+                if self._pending is None:
+                    continue  # Cancelled while settling
+
+                config = self._inflight = self._pending
+                self._pending = None
+
+            self.preview_started.emit()
+            scratch = self._scratch_for(config)
+            delivered = []
+
+            def emit_if_current(signal, value):
+                if not self._is_stale(config):
+                    delivered.append(True)
+                    signal.emit(value)
+
+            coarse_size = config.max_preview_size // PROGRESSIVE_COARSE_DIVISOR
+            if config.progressive and coarse_size > 0:
+                # Coarse pass; errors are reported by the full pass
+                render_preview(
+                    replace(config, max_preview_size=coarse_size),
+                    lambda: self._is_stale(config),
+                    lambda pixmap: emit_if_current(self.preview_coarse_ready, pixmap),
+                    lambda error: None,
+                    scratch
+                )
+                delivered.clear()
+
+            render_preview(
+                config,
+                lambda: self._is_stale(config),
+                lambda pixmap: emit_if_current(self.preview_ready, pixmap),
+                lambda error: emit_if_current(self.preview_error, error),
+                scratch
+            )
 
-    def _on_timeout(self):
-        """Timer fired - emit the pending request."""
-        with QMutexLocker(self._mutex):
-            if self._pending_config is not None:
-                self.preview_requested.emit(self._pending_config)
-                self._pending_config = None
+            with self._cond:
+                self._inflight = None
+                # Aborted, but re-requested (deduped) before noticing:
+                # render it again rather than dropping the request
+                if not delivered and self._pending is None and config == self._latest:
+                    self._pending = config
 
 
 # =============================================================================
@@ -442,35 +784,43 @@ class PreviewManager(QObject):
     High-level manager for preview generation.
     
     RESPONSIBILITIES:
-    1. Debounce incoming requests (via PreviewDebouncer)
-    2. Cancel old workers when new requests arrive
-    3. Manage worker lifecycle (creation, cleanup)
-    4. Forward signals to the UI
+    1. Hand requests to a single long-lived PreviewEngine thread, which
+       debounces them; a request supersedes any pending or in-progress
+       one ("latest wins", no queue)
+    2. Stop the engine thread when the application quits
+    3. Forward signals to the UI
+    4. Prewarm caches for images the user is likely to preview next
     
     USAGE:
         manager = PreviewManager(debounce_ms=50)
         manager.preview_updated.connect(on_preview_ready)
         manager.request_preview(config)
+        manager.prewarm(configs_for_other_images)
     
     THREAD SAFETY:
-    - All worker management is mutex-protected
-    - Workers are properly cleaned up on cancellation
+    - The engine's task slot is guarded by a condition variable
+    - Superseded renders stop cooperatively; threads are never terminated
     """
 
     preview_updated = pyqtSignal(object)  # QPixmap
+    preview_refining = pyqtSignal(object)  # QPixmap (coarse progressive frame)
     preview_error = pyqtSignal(str)
     preview_started = pyqtSignal()
 
     def __init__(self, debounce_ms: int = 50, parent=None):
         super().__init__(parent)
 
-        # Debouncer with tuned delay
-        self._debouncer = PreviewDebouncer(debounce_ms, self)
-        self._debouncer.preview_requested.connect(self._start_preview_worker)
+        # Persistent render thread with tuned debounce delay (started on
+        # the first request)
+        self._engine = PreviewEngine(debounce_ms, self)
+        self._engine.preview_started.connect(self.preview_started)
+        self._engine.preview_coarse_ready.connect(self.preview_refining)
+        self._engine.preview_ready.connect(self._on_preview_ready)
+        self._engine.preview_error.connect(self._on_preview_error)
 
-        # Current worker tracking
-        self._current_worker: Optional[PreviewWorker] = None
-        self._mutex = QMutex()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
 
     def request_preview(self, config: PreviewConfig):
         """
@@ -478,62 +828,49 @@ class PreviewManager(QObject):
         
         The request will be debounced - rapid successive calls
         will be collapsed into a single preview generation.
+        
+        Invalid configs (no image, empty text) are rejected here on the
+        calling thread: preview_error is emitted right away and the
+        engine's pending and in-progress work is dropped.
         """
-        self._debouncer.request_preview(config)
-
-    def cancel(self):
-        """Cancel all pending and in-progress preview work."""
-        self._debouncer.cancel()
-        self._cancel_current_worker()
+        error = config.validate()
+        if error:
+            self._engine.cancel()
+            self.preview_error.emit(error)
+            return
 
-    def clear_cache(self):
-        """Clear all caches (call when image list changes)."""
-        clear_proxy_cache()
+        self._engine.request_preview(config)
 
-    def _cancel_current_worker(self):
-        """Cancel and cleanup the current worker if any."""
-        with QMutexLocker(self._mutex):
-            if self._current_worker is not None:
-                # Request cancellation
-                self._current_worker.cancel()
-
-                # Disconnect signals to prevent late emissions
-                try:
-                    self._current_worker.preview_ready.disconnect()
-                    self._current_worker.preview_error.disconnect()
-                    self._current_worker.finished.disconnect()
-                except (TypeError, RuntimeError):
-                    pass  # Already disconnected
-
-                # Give the worker a moment to stop, then force quit
-                self._current_worker.quit()
-                if not self._current_worker.wait(50):  # 50ms timeout
-                    self._current_worker.terminate()
-                    self._current_worker.wait(50)
-
-                self._current_worker.deleteLater()
-                self._current_worker = None
-
-    def _start_preview_worker(self, config: PreviewConfig):
+    def prewarm(self, configs: Iterable[PreviewConfig]):
         """
-        Start a new preview worker.
+        Warm the proxy and font caches for previews likely to come next.
         
-        IMPORTANT: Always cancels any existing worker first to prevent
-        resource accumulation and ensure only one worker runs at a time.
+        Each config is prepared on the shared WORKER_POOL (see
+        prewarm_preview), so a later request_preview for it starts from a
+        cache hit. Nothing is emitted.
         """
-        # Cancel any existing worker
-        self._cancel_current_worker()
+        for config in configs:
+            WORKER_POOL.submit(prewarm_preview, config)
 
-        # Signal that preview is starting
-        self.preview_started.emit()
+    def set_debounce_ms(self, delay_ms: int):
+        """Change the debounce delay."""
+        self._engine.set_delay_ms(delay_ms)
 
-        # Create and start new worker
-        with QMutexLocker(self._mutex):
-            self._current_worker = PreviewWorker(config)
-            self._current_worker.preview_ready.connect(self._on_preview_ready)
-            self._current_worker.preview_error.connect(self._on_preview_error)
-            self._current_worker.finished.connect(self._on_worker_finished)
-            self._current_worker.start()
+    def cancel(self):
+        """Cancel all pending and in-progress preview work."""
+        self._engine.cancel()
+
+    def shutdown(self):
+        """Cancel pending work and stop the engine thread."""
+        self._engine.stop()
+
+    def clear_cache(self):
+        """Clear all caches."""
+        clear_proxy_cache()
+
+    def forget_images(self, image_paths: Iterable[Path]):
+        """Drop cached proxies for images no longer in the list."""
+        evict_proxy_cache(image_paths)
 
     def _on_preview_ready(self, pixmap: QPixmap):
         """Forward preview result to subscribers."""
@@ -542,10 +879,3 @@ class PreviewManager(QObject):
     def _on_preview_error(self, error: str):
         """Forward preview error to subscribers."""
         self.preview_error.emit(error)
-
-    def _on_worker_finished(self):
-        """Cleanup worker after completion."""
-        with QMutexLocker(self._mutex):
-            if self._current_worker is not None:
-                self._current_worker.deleteLater()
-                self._current_worker = None
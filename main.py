@@ -93,12 +93,18 @@ class WatermarkController:
             self.window.show_error("配置錯誤", str(e))
             return
 
+        # Don't spin up a worker thread for a config it would reject
+        error = config.validate()
+        if error:
+            self.window.show_error("配置錯誤", error)
+            return
+
         # Create and start worker
         self._embed_worker = EmbedWorker(config)
 
         # Connect worker signals
         self._embed_worker.progress.connect(self._on_embed_progress)
-        self._embed_worker.image_completed.connect(self._on_embed_image_completed)
+        self._embed_worker.images_completed_batch.connect(self._on_embed_images_completed)
         self._embed_worker.finished_all.connect(self._on_embed_finished)
         self._embed_worker.error.connect(self._on_embed_error)
 
@@ -197,8 +203,15 @@ class WatermarkController:
         self.embed_tab.set_progress(current, total, filename)
         self.window.show_message(f"處理中: {filename} ({current}/{total})")
 
-    def _on_embed_image_completed(self, result: EmbedResult):
-        """Handle single image completion."""
+    def _on_embed_images_completed(self, results: list):
+        """
+        Handle a batch of completed images.
+        
+        The status shows the first failure in the batch if there is one,
+        otherwise the latest success.
+        """
+        failed = [r for r in results if not r.success]
+        result: EmbedResult = failed[0] if failed else results[-1]
         if result.success:
             status = f"✅ {result.source_path.name} 處理完成"
         else:
@@ -323,6 +336,12 @@ class WatermarkController:
             bit_length=config_dict["bit_length"]
         )
 
+        # Don't spin up a worker thread for a config it would reject
+        error = config.validate()
+        if error:
+            self.window.show_error("配置錯誤", error)
+            return
+
         # Create and start worker
         self._extract_worker = ExtractWorker(config)
 
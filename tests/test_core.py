@@ -5,16 +5,26 @@ Run with: python -m pytest tests/test_core.py -v
 Or simply: python tests/test_core.py
 """
 
+import atexit
+import contextlib
 import gc
+import math
+import os
+import shutil
+import struct
 import sys
 import tempfile
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from PIL import Image
+from PIL import Image, ImageDraw
 import numpy as np
 
 from app.core.visible import VisibleWatermarker
@@ -30,10 +40,12 @@ def safe_delete(file_path: Path, max_retries: int = 3, delay: float = 0.5):
 
     for attempt in range(max_retries):
         try:
-            gc.collect()
             file_path.unlink()
             return
         except PermissionError:
+            if attempt == 0:
+                # Release any handle still held by an unreachable object
+                gc.collect()
             if attempt < max_retries - 1:
                 time.sleep(delay)
             else:
@@ -42,74 +54,100 @@ def safe_delete(file_path: Path, max_retries: int = 3, delay: float = 0.5):
 
 def create_test_image(width: int = 800, height: int = 600) -> Path:
     """Create a simple test image with gradient."""
-    arr = np.zeros((height, width, 3), dtype=np.uint8)
-    for y in range(height):
-        for x in range(width):
-            arr[y, x] = [
-                int(255 * x / width),
-                int(255 * y / height),
-                128
-            ]
-
-    img = Image.fromarray(arr, mode="RGB")
-    temp_path = Path(tempfile.mktemp(suffix=".png"))
-    img.save(temp_path)
-    img.close()
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    arr[..., 0] = (np.arange(width) * 255 // width)[None, :]
+    arr[..., 1] = (np.arange(height) * 255 // height)[:, None]
+    arr[..., 2] = 128
+
+    # BMP stores raw pixels, so writing the fixture skips the deflate pass
+    fd, temp_name = tempfile.mkstemp(suffix=".bmp")
+    os.close(fd)
+    temp_path = Path(temp_name)
+    Image.fromarray(arr, mode="RGB").save(temp_path, format="BMP")
     return temp_path
 
 
+# Test images shared by every test in the module, keyed by size. They are
+# only ever read, so each one is written once and removed at exit.
+_shared_images: Dict[Tuple[int, int], Path] = {}
+_shared_images_lock = threading.Lock()
+
+
+def get_test_image(width: int = 800, height: int = 600) -> Path:
+    """Return the shared test image of the given size, creating it on first use."""
+    key = (width, height)
+    with _shared_images_lock:
+        if key not in _shared_images:
+            _shared_images[key] = create_test_image(width, height)
+            atexit.register(safe_delete, _shared_images[key])
+        return _shared_images[key]
+
+
+@contextlib.contextmanager
+def watermark_fixture(width: int = 800, height: int = 600):
+    """
+    Provide the shared test image and a fresh output directory.
+    
+    Yields:
+        Tuple of (test_image, output_dir). The output directory and
+        everything written to it are removed on exit.
+    """
+    output_dir = Path(tempfile.mkdtemp())
+    try:
+        yield get_test_image(width, height), output_dir
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
 def test_visible_watermark():
     """Test visible watermark functionality."""
     print("\n" + "=" * 50)
     print("Testing Visible Watermark")
     print("=" * 50)
 
-    test_image = create_test_image()
-    output_path = test_image.parent / "test_visible_output.png"
-    result = None
-    wm = None
-
-    try:
-        wm = VisibleWatermarker()
+    with watermark_fixture() as (test_image, output_dir):
+        output_path = output_dir / "test_visible_output.png"
+        wm = None
 
-        result = wm.process(
-            image_path=test_image,
-            text="NightCat © 2024",
-            size=50,
-            opacity=100,
-            angle=-30,
-            output_path=output_path
-        )
+        try:
+            wm = VisibleWatermarker()
+
+            result = wm.process(
+                image_path=test_image,
+                text="NightCat © 2024",
+                size=50,
+                opacity=100,
+                angle=-30,
+                output_path=output_path
+            )
 
-        result_size = result.size
+            result_size = result.size
 
-        print(f"✅ Visible watermark applied successfully!")
-        print(f"   Input: {test_image}")
-        print(f"   Output: {output_path}")
-        print(f"   Result size: {result_size}")
+            print(f"✅ Visible watermark applied successfully!")
+            print(f"   Input: {test_image}")
+            print(f"   Output: {output_path}")
+            print(f"   Result size: {result_size}")
 
-        assert output_path.exists(), "Output file not created"
+            assert output_path.exists(), "Output file not created"
 
-        with Image.open(output_path) as output_img:
-            assert output_img.size == result_size, "Size mismatch"
+            # Width and height sit right after the signature in the IHDR
+            # chunk, so the size check does not need a PNG decode
+            with open(output_path, "rb") as f:
+                header = f.read(24)
+            assert header[:8] == b"\x89PNG\r\n\x1a\n", "Output is not a PNG"
+            assert struct.unpack(">II", header[16:24]) == result_size, "Size mismatch"
 
-        print("✅ All visible watermark tests passed!")
-        return True
+            print("✅ All visible watermark tests passed!")
+            return True
 
-    except Exception as e:
-        print(f"❌ Visible watermark test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        except Exception as e:
+            print(f"❌ Visible watermark test failed: {e}")
+            traceback.print_exc()
+            return False
 
-    finally:
-        if result is not None:
-            result.close()
-        if wm is not None:
-            wm._cached_fonts.clear()
-        gc.collect()
-        safe_delete(test_image)
-        safe_delete(output_path)
+        finally:
+            if wm is not None:
+                wm.clear_font_cache()
 
 
 def test_blind_watermark():
@@ -119,66 +157,62 @@ def test_blind_watermark():
     print("=" * 50)
 
     # Use larger image for sufficient capacity
-    test_image = create_test_image(1024, 768)
-    output_path = None
-    adapter = None
+    with watermark_fixture(1024, 768) as (test_image, output_dir):
+        output_path = None
+        adapter = None
 
-    try:
-        adapter = BlindWatermarkerAdapter()
-
-        # Check image capacity
-        max_text_len = adapter.get_max_text_length(test_image)
-        print(f"   Image capacity: {max_text_len} bytes")
-
-        password = "MySecretKey123"
-        original_text = "Hello, this is a secret message! 你好世界"
-
-        print(f"   Original text: {original_text}")
-        print(f"   Text length: {len(original_text.encode('utf-8'))} bytes")
-        print(f"   Password: {password}")
-
-        # Embed watermark
-        print("\n📝 Embedding watermark...")
-        output_path, bit_length = adapter.embed(
-            image_path=test_image,
-            password=password,
-            text=original_text
-        )
-
-        print(f"✅ Watermark embedded!")
-        print(f"   Output: {output_path}")
-        print(f"   Bit length: {bit_length}")
-
-        # Extract watermark (must provide bit_length)
-        print("\n🔍 Extracting watermark...")
-        extracted_text = adapter.extract(
-            image_path=output_path,
-            password=password,
-            bit_length=bit_length
-        )
-
-        print(f"✅ Watermark extracted!")
-        print(f"   Extracted text: {extracted_text}")
-
-        assert extracted_text == original_text, \
-            f"Text mismatch: expected '{original_text}', got '{extracted_text}'"
-
-        print("\n✅ All blind watermark tests passed!")
-        return True
-
-    except Exception as e:
-        print(f"❌ Blind watermark test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        try:
+            adapter = BlindWatermarkerAdapter()
+
+            # Check image capacity
+            max_text_len = adapter.get_max_text_length(test_image)
+            print(f"   Image capacity: {max_text_len} bytes")
+
+            password = "MySecretKey123"
+            original_text = "Hello, this is a secret message! 你好世界"
+
+            print(f"   Original text: {original_text}")
+            print(f"   Text length: {len(original_text.encode('utf-8'))} bytes")
+            print(f"   Password: {password}")
+
+            # Embed watermark
+            print("\n📝 Embedding watermark...")
+            output_path, bit_length = adapter.embed(
+                image_path=test_image,
+                password=password,
+                text=original_text,
+                output_path=output_dir / "blind_roundtrip.png"
+            )
 
-    finally:
-        if adapter is not None:
-            adapter.cleanup()
-        gc.collect()
-        safe_delete(test_image)
-        if output_path:
-            safe_delete(output_path)
+            print(f"✅ Watermark embedded!")
+            print(f"   Output: {output_path}")
+            print(f"   Bit length: {bit_length}")
+
+            # Extract watermark (must provide bit_length)
+            print("\n🔍 Extracting watermark...")
+            extracted_text = adapter.extract(
+                image_path=output_path,
+                password=password,
+                bit_length=bit_length
+            )
+
+            print(f"✅ Watermark extracted!")
+            print(f"   Extracted text: {extracted_text}")
+
+            assert extracted_text == original_text, \
+                f"Text mismatch: expected '{original_text}', got '{extracted_text}'"
+
+            print("\n✅ All blind watermark tests passed!")
+            return True
+
+        except Exception as e:
+            print(f"❌ Blind watermark test failed: {e}")
+            traceback.print_exc()
+            return False
+
+        finally:
+            if adapter is not None:
+                adapter.cleanup()
 
 
 def test_wrong_password():
@@ -187,48 +221,44 @@ def test_wrong_password():
     print("Testing Wrong Password Detection")
     print("=" * 50)
 
-    test_image = create_test_image(1024, 768)
-    output_path = None
-    adapter = None
+    with watermark_fixture(1024, 768) as (test_image, output_dir):
+        output_path = None
+        adapter = None
 
-    try:
-        adapter = BlindWatermarkerAdapter()
-
-        # Embed with one password
-        output_path, bit_length = adapter.embed(
-            image_path=test_image,
-            password="CorrectPassword",
-            text="Secret data"
-        )
-        print("✅ Watermark embedded with 'CorrectPassword'")
-
-        # Try to extract with wrong password
-        print("🔍 Attempting extraction with wrong password...")
         try:
-            adapter.extract(
-                image_path=output_path,
-                password="WrongPassword",
-                bit_length=bit_length
+            adapter = BlindWatermarkerAdapter()
+
+            # Embed with one password
+            output_path, bit_length = adapter.embed(
+                image_path=test_image,
+                password="CorrectPassword",
+                text="Secret data",
+                output_path=output_dir / "wrong_password.png"
             )
-            print("❌ Should have raised an error!")
+            print("✅ Watermark embedded with 'CorrectPassword'")
+
+            # Try to extract with wrong password
+            print("🔍 Attempting extraction with wrong password...")
+            try:
+                adapter.extract(
+                    image_path=output_path,
+                    password="WrongPassword",
+                    bit_length=bit_length
+                )
+                print("❌ Should have raised an error!")
+                return False
+            except ValueError as e:
+                print(f"✅ Correctly detected wrong password: {e}")
+                return True
+
+        except Exception as e:
+            print(f"❌ Test failed: {e}")
+            traceback.print_exc()
             return False
-        except ValueError as e:
-            print(f"✅ Correctly detected wrong password: {e}")
-            return True
 
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    finally:
-        if adapter is not None:
-            adapter.cleanup()
-        gc.collect()
-        safe_delete(test_image)
-        if output_path:
-            safe_delete(output_path)
+        finally:
+            if adapter is not None:
+                adapter.cleanup()
 
 
 def test_combined_watermarks():
@@ -237,79 +267,194 @@ def test_combined_watermarks():
     print("Testing Combined Watermarks")
     print("=" * 50)
 
-    test_image = create_test_image(1024, 768)
-    output_visible = test_image.parent / "combined_step1.png"
-    output_final = None
-    visible_result = None
-    visible_wm = None
-    blind_wm = None
+    with watermark_fixture(1024, 768) as (test_image, output_dir):
+        output_final = output_dir / "combined_final.png"
+        visible_wm = None
+        blind_wm = None
+
+        try:
+            # Step 1: Apply visible watermark
+            visible_wm = VisibleWatermarker()
+            visible_result = visible_wm.process(
+                image_path=test_image,
+                text="© NightCat",
+                size=40,
+                opacity=80,
+                angle=-25
+            )
+            print("✅ Step 1: Visible watermark applied")
+
+            # Step 2: Apply blind watermark to the in-memory visible result
+            blind_wm = BlindWatermarkerAdapter()
+            password = "Combined123"
+            secret_text = "Licensed to User123"
+
+            _, bit_length = blind_wm.embed_image_with(
+                blind_wm.prepare(password, secret_text),
+                visible_result,
+                output_path=output_final
+            )
+            print("✅ Step 2: Blind watermark embedded")
+
+            # Step 3: Verify extraction
+            extracted = blind_wm.extract(output_final, password, bit_length)
+            assert extracted == secret_text
+            print(f"✅ Step 3: Blind watermark verified: {extracted}")
+
+            print("\n✅ Combined watermark test passed!")
+            return True
+
+        except Exception as e:
+            print(f"❌ Combined watermark test failed: {e}")
+            traceback.print_exc()
+            return False
+
+        finally:
+            if visible_wm is not None:
+                visible_wm.clear_font_cache()
+            if blind_wm is not None:
+                blind_wm.cleanup()
+
+
+def _reference_tile(
+        wm: VisibleWatermarker,
+        text: str,
+        font_size: int,
+        opacity: int,
+        angle: float,
+        color: Tuple[int, int, int]
+) -> Image.Image:
+    """
+    Build a watermark tile the pre-mask-cache way: draw the colored,
+    translucent text on an RGBA canvas and rotate the whole RGBA stamp.
+    """
+    font = wm._get_font(font_size)
+    bbox = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    diagonal = int(math.sqrt(text_width ** 2 + text_height ** 2))
+    canvas_size = diagonal + int(diagonal * 0.1)
+
+    tile = Image.new("RGBA", (canvas_size, canvas_size), (0, 0, 0, 0))
+    ImageDraw.Draw(tile).text(
+        ((canvas_size - text_width) // 2, (canvas_size - text_height) // 2),
+        text, font=font, fill=(*color, opacity)
+    )
+    if angle != 0:
+        tile = tile.rotate(angle, expand=True, resample=Image.BICUBIC)
+    return tile
+
+
+def test_rotated_tile_matches_reference():
+    """
+    Test the cached-mask tile against rotating the RGBA stamp directly.
+    
+    Rotating the coverage mask and tinting afterwards only changes
+    antialiased edge pixels: the old path's bicubic rotation mixed the
+    transparent black canvas into the text color and could overshoot the
+    requested opacity. Composited over a solid background, the tiles must
+    agree to within 48 levels on any pixel, 0.25 levels on average, and
+    with under 2% of pixels off by more than 2 levels.
+    """
+    print("\n" + "=" * 50)
+    print("Testing Rotated Tile vs Reference")
+    print("=" * 50)
+
+    wm = None
 
     try:
-        # Step 1: Apply visible watermark
-        visible_wm = VisibleWatermarker()
-        visible_result = visible_wm.process(
-            image_path=test_image,
-            text="© NightCat",
-            size=40,
-            opacity=80,
-            angle=-25,
-            output_path=output_visible
-        )
-        visible_result.close()
-        visible_result = None
-        print("✅ Step 1: Visible watermark applied")
-
-        # Step 2: Apply blind watermark
-        blind_wm = BlindWatermarkerAdapter()
-        password = "Combined123"
-        secret_text = "Licensed to User123"
-
-        output_final, bit_length = blind_wm.embed(
-            image_path=output_visible,
-            password=password,
-            text=secret_text
-        )
-        print("✅ Step 2: Blind watermark embedded")
-
-        # Step 3: Verify extraction
-        extracted = blind_wm.extract(output_final, password, bit_length)
-        assert extracted == secret_text
-        print(f"✅ Step 3: Blind watermark verified: {extracted}")
-
-        print("\n✅ Combined watermark test passed!")
-        return True
-
-    except Exception as e:
-        print(f"❌ Combined watermark test failed: {e}")
-        import traceback
+        wm = VisibleWatermarker()
+        cases = [
+            ("NightCat © 2024", 40, 80, -30, (128, 128, 128)),
+            ("NightCat © 2024", 80, 255, 45, (255, 255, 255)),
+            ("測試 watermark", 60, 80, 17.5, (0, 0, 0)),
+            ("測試 watermark", 30, 200, 0, (255, 0, 0)),
+        ]
+
+        for text, size, opacity, angle, color in cases:
+            reference = _reference_tile(wm, text, size, opacity, angle, color)
+            tile, _ = wm._create_watermark_tile(text, size, opacity, angle, color)
+            assert tile.size == reference.size, "Tile size mismatch"
+
+            background = Image.new("RGBA", tile.size, (30, 160, 90, 255))
+            expected = np.asarray(Image.alpha_composite(background, reference)).astype(np.int16)
+            actual = np.asarray(Image.alpha_composite(background, tile)).astype(np.int16)
+            diff = np.abs(expected - actual)[..., :3]
+
+            print(f"   {text} size={size} opacity={opacity} angle={angle}: "
+                  f"max {diff.max()}, mean {diff.mean():.3f}")
+            assert diff.max() <= 48, f"Max difference {diff.max()} > 48"
+            assert diff.mean() <= 0.25, f"Mean difference {diff.mean():.3f} > 0.25"
+            assert (diff.max(axis=-1) > 2).mean() < 0.02, "Too many differing pixels"
+
+        print("✅ Rotated tiles match the reference within tolerance!")
+
+    finally:
+        if wm is not None:
+            wm.clear_font_cache()
+
+
+# Core tests in report order. Each one uses its own watermarker instances
+# and output file, so main() can run them side by side.
+TESTS = {
+    "Visible Watermark": test_visible_watermark,
+    "Blind Watermark": test_blind_watermark,
+    "Wrong Password": test_wrong_password,
+    "Combined Watermarks": test_combined_watermarks,
+    "Rotated Tile": test_rotated_tile_matches_reference,
+}
+
+
+def run_for_summary(test: Callable) -> bool:
+    """
+    Run one test for main()'s summary.
+    
+    Older tests report failure by returning False; newer ones raise, as
+    pytest expects. Both count as a failure here.
+    """
+    try:
+        return test() is not False
+    except AssertionError as e:
+        print(f"❌ {test.__name__} failed: {e}")
         traceback.print_exc()
         return False
 
-    finally:
-        if visible_result is not None:
-            visible_result.close()
-        if visible_wm is not None:
-            visible_wm._cached_fonts.clear()
-        if blind_wm is not None:
-            blind_wm.cleanup()
-        gc.collect()
-        safe_delete(test_image)
-        safe_delete(output_visible)
-        if output_final:
-            safe_delete(output_final)
+# Tests that are skipped when a test they build on has failed
+DEPENDS: Dict[str, Tuple[str, ...]] = {
+    "Wrong Password": ("Blind Watermark",),
+    "Combined Watermarks": ("Visible Watermark", "Blind Watermark"),
+}
 
 
 def main():
-    """Run all tests."""
+    """
+    Run all tests.
+    
+    Tests run concurrently on a thread pool, in rounds: a test starts once
+    the tests it depends on have finished, and is skipped if any of them
+    failed.
+    """
     print("🧪 WatermarkMaster Core Module Tests")
     print("=" * 50)
 
-    results = []
+    outcomes: Dict[str, Optional[bool]] = {}  # None means skipped
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+        while len(outcomes) < len(TESTS):
+            futures = {}
+            for name, test in TESTS.items():
+                deps = DEPENDS.get(name, ())
+                if name in outcomes or not all(dep in outcomes for dep in deps):
+                    continue
+                if all(outcomes[dep] for dep in deps):
+                    futures[name] = executor.submit(run_for_summary, test)
+                else:
+                    outcomes[name] = None
+
+            for name, future in futures.items():
+                outcomes[name] = future.result()
 
-    results.append(("Visible Watermark", test_visible_watermark()))
-    results.append(("Blind Watermark", test_blind_watermark()))
-    results.append(("Wrong Password", test_wrong_password()))
-    results.append(("Combined Watermarks", test_combined_watermarks()))
+    results = [(name, outcomes[name]) for name in TESTS]
 
     # Summary
     print("\n" + "=" * 50)
@@ -320,7 +465,10 @@ def main():
     total = len(results)
 
     for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+        if result is None:
+            status = "⏭️ SKIP"
+        else:
+            status = "✅ PASS" if result else "❌ FAIL"
         print(f"  {name}: {status}")
 
     print(f"\nTotal: {passed}/{total} tests passed")
@@ -4,11 +4,16 @@ Test script for worker threads.
 Run with: python tests/test_workers.py
 """
 
+import atexit
 import gc
+import os
+import shutil
 import sys
 import tempfile
 import time
+import traceback
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,8 +21,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from PIL import Image
 import numpy as np
 
+try:
+    import pytest
+    slow = pytest.mark.slow
+except ImportError:
+    # Running as a plain script without pytest installed
+    def slow(test):
+        return test
+
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtCore import QCoreApplication, QDeadlineTimer, QThread
 
 from app.workers import (
     EmbedWorker, EmbedConfig, VisibleConfig, BlindConfig, EmbedResult,
@@ -43,10 +56,12 @@ def safe_delete(file_path: Path, max_retries: int = 3, delay: float = 0.5):
 
     for attempt in range(max_retries):
         try:
-            gc.collect()
             file_path.unlink()
             return
         except PermissionError:
+            if attempt == 0:
+                # Release any handle still held by an unreachable object
+                gc.collect()
             if attempt < max_retries - 1:
                 time.sleep(delay)
             else:
@@ -55,85 +70,133 @@ def safe_delete(file_path: Path, max_retries: int = 3, delay: float = 0.5):
 
 def create_test_image(width: int = 1024, height: int = 768) -> Path:
     """Create a simple test image."""
-    arr = np.zeros((height, width, 3), dtype=np.uint8)
-    for y in range(height):
-        for x in range(width):
-            arr[y, x] = [
-                int(255 * x / width),
-                int(255 * y / height),
-                128
-            ]
-
-    img = Image.fromarray(arr, mode="RGB")
-    temp_path = Path(tempfile.mktemp(suffix=".png"))
-    img.save(temp_path)
-    img.close()
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    arr[..., 0] = (np.arange(width) * 255 // width)[None, :]
+    arr[..., 1] = (np.arange(height) * 255 // height)[:, None]
+    arr[..., 2] = 128
+
+    # BMP stores raw pixels, so writing the fixture skips the deflate pass
+    fd, temp_name = tempfile.mkstemp(suffix=".bmp")
+    os.close(fd)
+    temp_path = Path(temp_name)
+    Image.fromarray(arr, mode="RGB").save(temp_path, format="BMP")
     return temp_path
 
 
-def wait_for_signal(signal, timeout_ms: int = 30000):
-    """
-    Wait for a Qt signal with timeout.
-    
-    Returns:
-        The value emitted by the signal, or None if timeout.
-    """
-    app = get_app()
-    loop = QEventLoop()
-    result = [None]
+# Test image shared by every test in the module. It is only ever read, so
+# it is written once and removed at exit.
+_shared_image: Optional[Path] = None
 
-    def on_signal(*args):
-        result[0] = args[0] if len(args) == 1 else args
-        loop.quit()
 
-    signal.connect(on_signal)
+def get_test_image() -> Path:
+    """Return the shared test image, creating it on first use."""
+    global _shared_image
+    if _shared_image is None:
+        _shared_image = create_test_image()
+        atexit.register(safe_delete, _shared_image)
+    return _shared_image
 
-    # Setup timeout
-    timer = QTimer()
-    timer.setSingleShot(True)
-    timer.timeout.connect(loop.quit)
-    timer.start(timeout_ms)
 
-    loop.exec()
-    timer.stop()
+# Parent directory for every case's output, removed in one go at exit
+_work_dir: Optional[Path] = None
 
-    return result[0]
 
+def get_work_dir() -> Path:
+    """Return the module's shared work directory, creating it on first use."""
+    global _work_dir
+    if _work_dir is None:
+        _work_dir = Path(tempfile.mkdtemp(prefix="nightcat_workers_"))
+        atexit.register(shutil.rmtree, _work_dir, True)
+    return _work_dir
 
-def test_embed_worker_visible_only():
-    """Test EmbedWorker with visible watermark only."""
-    print("\n" + "=" * 50)
-    print("Testing EmbedWorker - Visible Only")
-    print("=" * 50)
 
+def run_cases(builders: Dict[str, Callable], timeout_ms: int = 30000) -> Dict[str, bool]:
+    """
+    Run worker test cases concurrently and validate each one.
+    
+    Each builder is called as build(output_dir, on_done) and returns
+    (workers, validate), where workers is a list the case may append
+    chained workers to. All workers are started together and joined with
+    QThread.wait(); their queued signals are then delivered with
+    sendPostedEvents() until every case has called on_done, nothing is
+    left running, or the timeout expires. validate(payload) then checks
+    each case in turn.
+    
+    Returns:
+        Mapping of case name to whether it passed.
+    """
     get_app()
-    test_image = create_test_image()
-    output_dir = Path(tempfile.mkdtemp())
-
-    try:
-        config = EmbedConfig(
-            image_paths=[test_image],
-            output_dir=output_dir,
-            visible=VisibleConfig(
-                enabled=True,
-                text="© NightCat 2024",
-                font_size=50,
-                opacity=100,
-                angle=-30
-            ),
-            blind=BlindConfig(enabled=False)
-        )
+    done: Dict[str, Any] = {}
+    cases: Dict[str, Tuple[List[QThread], Callable]] = {}
 
-        worker = EmbedWorker(config)
+    for name, build in builders.items():
+        def on_done(payload, name=name):
+            done[name] = payload
 
-        # Track progress
-        progress_log = []
-        worker.progress.connect(lambda c, t, f: progress_log.append((c, t, f)))
+        slug = name.lower().replace(" ", "_")
+        output_dir = Path(tempfile.mkdtemp(prefix=f"{slug}_", dir=get_work_dir()))
+        cases[name] = build(output_dir, on_done)
 
+    def all_workers() -> List[QThread]:
+        return [worker for workers, _ in cases.values() for worker in workers]
+
+    for worker in all_workers():
         worker.start()
-        results = wait_for_signal(worker.finished_all)
 
-        assert results is not None, "Worker timed out"
+    deadline = QDeadlineTimer(timeout_ms)
+    while len(done) < len(cases) and not deadline.hasExpired():
+        workers = all_workers()
+        for worker in workers:
+            worker.wait(deadline)
+
+        # Deliver the queued worker signals (this may start chained workers)
+        QCoreApplication.sendPostedEvents()
+
+        if len(all_workers()) == len(workers) and all(w.isFinished() for w in workers):
+            break
+
+    outcomes: Dict[str, bool] = {}
+    for name, (_, validate) in cases.items():
+        print("\n" + "=" * 50)
+        print(f"Testing EmbedWorker - {name}")
+        print("=" * 50)
+
+        try:
+            assert name in done, "Worker timed out"
+            validate(done[name])
+            outcomes[name] = True
+
+        except Exception as e:
+            print(f"❌ Test failed: {e}")
+            traceback.print_exc()
+            outcomes[name] = False
+
+    return outcomes
+
+
+def build_visible_only(output_dir: Path, on_done: Callable):
+    """Build the EmbedWorker case with visible watermark only."""
+    config = EmbedConfig(
+        image_paths=[get_test_image()],
+        output_dir=output_dir,
+        visible=VisibleConfig(
+            enabled=True,
+            text="© NightCat 2024",
+            font_size=50,
+            opacity=100,
+            angle=-30
+        ),
+        blind=BlindConfig(enabled=False)
+    )
+
+    worker = EmbedWorker(config)
+
+    # Track progress
+    progress_log = []
+    worker.progress.connect(lambda c, t, f: progress_log.append((c, t, f)))
+    worker.finished_all.connect(on_done)
+
+    def validate(results):
         assert len(results) == 1, f"Expected 1 result, got {len(results)}"
 
         result: EmbedResult = results[0]
@@ -143,53 +206,27 @@ def test_embed_worker_visible_only():
         print(f"✅ Visible watermark embedded successfully!")
         print(f"   Output: {result.output_path}")
         print(f"   Progress log: {progress_log}")
-        return True
-
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    finally:
-        gc.collect()
-        safe_delete(test_image)
-        # Clean output dir
-        for f in output_dir.glob("*"):
-            safe_delete(f)
-        try:
-            output_dir.rmdir()
-        except:
-            pass
 
+    return [worker], validate
 
-def test_embed_worker_blind_only():
-    """Test EmbedWorker with blind watermark only."""
-    print("\n" + "=" * 50)
-    print("Testing EmbedWorker - Blind Only")
-    print("=" * 50)
 
-    get_app()
-    test_image = create_test_image()
-    output_dir = Path(tempfile.mkdtemp())
-
-    try:
-        config = EmbedConfig(
-            image_paths=[test_image],
-            output_dir=output_dir,
-            visible=VisibleConfig(enabled=False),
-            blind=BlindConfig(
-                enabled=True,
-                text="Secret message for testing",
-                password="TestPassword123"
-            )
+def build_blind_only(output_dir: Path, on_done: Callable):
+    """Build the EmbedWorker case with blind watermark only."""
+    config = EmbedConfig(
+        image_paths=[get_test_image()],
+        output_dir=output_dir,
+        visible=VisibleConfig(enabled=False),
+        blind=BlindConfig(
+            enabled=True,
+            text="Secret message for testing",
+            password="TestPassword123"
         )
+    )
 
-        worker = EmbedWorker(config)
-        worker.start()
-        results = wait_for_signal(worker.finished_all)
+    worker = EmbedWorker(config)
+    worker.finished_all.connect(on_done)
 
-        assert results is not None, "Worker timed out"
+    def validate(results):
         assert len(results) == 1
 
         result: EmbedResult = results[0]
@@ -200,58 +237,61 @@ def test_embed_worker_blind_only():
         print(f"✅ Blind watermark embedded successfully!")
         print(f"   Output: {result.output_path}")
         print(f"   Bit length: {result.bit_length}")
-        return True
-
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    finally:
-        gc.collect()
-        safe_delete(test_image)
-        for f in output_dir.glob("*"):
-            safe_delete(f)
-        try:
-            output_dir.rmdir()
-        except:
-            pass
 
+    return [worker], validate
 
-def test_embed_worker_combined():
-    """Test EmbedWorker with both visible and blind watermarks."""
-    print("\n" + "=" * 50)
-    print("Testing EmbedWorker - Combined")
-    print("=" * 50)
 
-    get_app()
-    test_image = create_test_image()
-    output_dir = Path(tempfile.mkdtemp())
-
-    try:
-        config = EmbedConfig(
-            image_paths=[test_image],
-            output_dir=output_dir,
-            visible=VisibleConfig(
-                enabled=True,
-                text="© NightCat",
-                font_size=40,
-                opacity=80,
-                angle=-25
-            ),
-            blind=BlindConfig(
-                enabled=True,
-                text="Hidden message",
-                password="CombinedTest"
-            )
+def build_combined(output_dir: Path, on_done: Callable, extract: bool = False):
+    """
+    Build the EmbedWorker case with both visible and blind watermarks.
+    
+    The payload is (embed_results, extract_result). With extract=True an
+    ExtractWorker is chained off the embed result to check the text round
+    trip, and the case is done once it reports back; otherwise
+    extract_result is None and the case is done after the embed.
+    """
+    config = EmbedConfig(
+        image_paths=[get_test_image()],
+        output_dir=output_dir,
+        visible=VisibleConfig(
+            enabled=True,
+            text="© NightCat",
+            font_size=40,
+            opacity=80,
+            angle=-25
+        ),
+        blind=BlindConfig(
+            enabled=True,
+            text="Hidden message",
+            password="CombinedTest"
         )
+    )
 
-        worker = EmbedWorker(config)
-        worker.start()
-        results = wait_for_signal(worker.finished_all)
+    worker = EmbedWorker(config)
+    workers: List[QThread] = [worker]
+
+    def on_embedded(results):
+        if not extract or len(results) != 1 or not results[0].success:
+            on_done((results, None))
+            return
+
+        extract_config = ExtractConfig(
+            image_path=results[0].output_path,
+            password="CombinedTest",
+            bit_length=results[0].bit_length
+        )
+
+        extract_worker = ExtractWorker(extract_config)
+        extract_worker.result_ready.connect(
+            lambda extract_result: on_done((results, extract_result))
+        )
+        workers.append(extract_worker)
+        extract_worker.start()
 
-        assert results is not None, "Worker timed out"
+    worker.finished_all.connect(on_embedded)
+
+    def validate(payload):
+        results, extract_result = payload
         assert len(results) == 1
 
         result: EmbedResult = results[0]
@@ -262,75 +302,54 @@ def test_embed_worker_combined():
         print(f"   Output: {result.output_path}")
         print(f"   Bit length: {result.bit_length}")
 
-        # Now test extraction
-        print("\n🔍 Testing extraction...")
-        extract_config = ExtractConfig(
-            image_path=result.output_path,
-            password="CombinedTest",
-            bit_length=result.bit_length
-        )
-
-        extract_worker = ExtractWorker(extract_config)
-        extract_worker.start()
-        extract_result = wait_for_signal(extract_worker.result_ready)
+        if not extract:
+            return
 
-        assert extract_result is not None, "Extract worker timed out"
+        # Now check the chained extraction
+        print("\n🔍 Testing extraction...")
+        assert extract_result is not None, "Extract worker did not run"
         assert extract_result.success, f"Extract failed: {extract_result.error_message}"
         assert extract_result.extracted_text == "Hidden message"
 
         print(f"✅ Extraction successful: '{extract_result.extracted_text}'")
-        return True
-
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    finally:
-        gc.collect()
-        safe_delete(test_image)
-        for f in output_dir.glob("*"):
-            safe_delete(f)
-        try:
-            output_dir.rmdir()
-        except:
-            pass
 
+    return workers, validate
 
-def test_embed_worker_multiple_images():
-    """Test EmbedWorker with multiple images."""
-    print("\n" + "=" * 50)
-    print("Testing EmbedWorker - Multiple Images")
-    print("=" * 50)
 
-    get_app()
-    test_images = [create_test_image() for _ in range(3)]
-    output_dir = Path(tempfile.mkdtemp())
-
-    try:
-        config = EmbedConfig(
-            image_paths=test_images,
-            output_dir=output_dir,
-            visible=VisibleConfig(
-                enabled=True,
-                text="Batch Test",
-                font_size=35,
-                opacity=90
-            ),
-            blind=BlindConfig(enabled=False)
-        )
+def build_combined_extract(output_dir: Path, on_done: Callable):
+    """Build the combined case with the blind extract round trip chained on."""
+    return build_combined(output_dir, on_done, extract=True)
 
-        worker = EmbedWorker(config)
 
-        # Track progress
-        progress_log = []
-        worker.progress.connect(lambda c, t, f: progress_log.append((c, t, f)))
+def build_multiple_images(output_dir: Path, on_done: Callable):
+    """Build the EmbedWorker case with multiple images."""
+    # Separate copies so each image gets its own output file (the copies
+    # live in output_dir and are removed with the work directory)
+    test_images = [
+        Path(shutil.copy(get_test_image(), output_dir / f"batch_{i}.bmp"))
+        for i in range(3)
+    ]
 
-        worker.start()
-        results = wait_for_signal(worker.finished_all)
+    config = EmbedConfig(
+        image_paths=test_images,
+        output_dir=output_dir,
+        visible=VisibleConfig(
+            enabled=True,
+            text="Batch Test",
+            font_size=35,
+            opacity=90
+        ),
+        blind=BlindConfig(enabled=False)
+    )
 
-        assert results is not None, "Worker timed out"
+    worker = EmbedWorker(config)
+
+    # Track progress
+    progress_log = []
+    worker.progress.connect(lambda c, t, f: progress_log.append((c, t, f)))
+    worker.finished_all.connect(on_done)
+
+    def validate(results):
         assert len(results) == 3, f"Expected 3 results, got {len(results)}"
 
         success_count = sum(1 for r in results if r.success)
@@ -339,37 +358,77 @@ def test_embed_worker_multiple_images():
         print(f"✅ Batch processing successful!")
         print(f"   Processed: {len(results)} images")
         print(f"   Progress log: {progress_log}")
-        return True
-
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    finally:
-        gc.collect()
-        for img in test_images:
-            safe_delete(img)
-        for f in output_dir.glob("*"):
-            safe_delete(f)
-        try:
-            output_dir.rmdir()
-        except:
-            pass
+
+    return [worker], validate
+
+
+# Worker test cases in report order. The embed-only "Combined" case is left
+# out: "Combined Extract" runs the same embed and then checks the extract.
+CASES: Dict[str, Callable] = {
+    "Visible Only": build_visible_only,
+    "Blind Only": build_blind_only,
+    "Combined Extract": build_combined_extract,
+    "Multiple Images": build_multiple_images,
+}
+
+# Cases that are skipped when a case they build on has failed
+DEPENDS: Dict[str, Tuple[str, ...]] = {
+    "Combined Extract": ("Visible Only", "Blind Only"),
+    "Multiple Images": ("Visible Only",),
+}
+
+
+def test_embed_worker_visible_only():
+    """Test EmbedWorker with visible watermark only."""
+    return run_cases({"Visible Only": build_visible_only})["Visible Only"]
+
+
+def test_embed_worker_blind_only():
+    """Test EmbedWorker with blind watermark only."""
+    return run_cases({"Blind Only": build_blind_only})["Blind Only"]
+
+
+def test_embed_worker_combined():
+    """Test EmbedWorker with both visible and blind watermarks."""
+    return run_cases({"Combined": build_combined})["Combined"]
+
+
+@slow
+def test_embed_worker_combined_extract():
+    """Test that the combined EmbedWorker output extracts with ExtractWorker."""
+    return run_cases({"Combined Extract": build_combined_extract})["Combined Extract"]
+
+
+def test_embed_worker_multiple_images():
+    """Test EmbedWorker with multiple images."""
+    return run_cases({"Multiple Images": build_multiple_images})["Multiple Images"]
 
 
 def main():
-    """Run all tests."""
+    """
+    Run all tests.
+    
+    The worker cases run concurrently, in rounds: a case starts once the
+    cases it depends on have finished, and is skipped if any of them failed.
+    """
     print("🧪 WatermarkMaster Worker Tests")
     print("=" * 50)
 
-    results = []
+    outcomes: Dict[str, Optional[bool]] = {}  # None means skipped
+    while len(outcomes) < len(CASES):
+        ready: Dict[str, Callable] = {}
+        for name, build in CASES.items():
+            deps = DEPENDS.get(name, ())
+            if name in outcomes or not all(dep in outcomes for dep in deps):
+                continue
+            if all(outcomes[dep] for dep in deps):
+                ready[name] = build
+            else:
+                outcomes[name] = None
+
+        outcomes.update(run_cases(ready))
 
-    results.append(("Visible Only", test_embed_worker_visible_only()))
-    results.append(("Blind Only", test_embed_worker_blind_only()))
-    results.append(("Combined", test_embed_worker_combined()))
-    results.append(("Multiple Images", test_embed_worker_multiple_images()))
+    results = [(name, outcomes[name]) for name in CASES]
 
     # Summary
     print("\n" + "=" * 50)
@@ -380,7 +439,10 @@ def main():
     total = len(results)
 
     for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+        if result is None:
+            status = "⏭️ SKIP"
+        else:
+            status = "✅ PASS" if result else "❌ FAIL"
         print(f"  {name}: {status}")
 
     print(f"\nTotal: {passed}/{total} tests passed")